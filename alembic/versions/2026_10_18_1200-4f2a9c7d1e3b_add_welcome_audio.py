@@ -0,0 +1,38 @@
+"""add welcome audio
+
+Revision ID: 4f2a9c7d1e3b
+Revises: ebca14f6087d
+Create Date: 2026-10-18 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4f2a9c7d1e3b"
+down_revision: Union[str, Sequence[str], None] = "ebca14f6087d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "interview_questions",
+        sa.Column("welcome_audio", sa.LargeBinary(), nullable=True),
+    )
+    op.add_column(
+        "interview_questions",
+        sa.Column("welcome_sample_rate", sa.Integer(), nullable=True),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table("interview_questions") as batch_op:
+        batch_op.drop_column("welcome_sample_rate")
+        batch_op.drop_column("welcome_audio")
@@ -0,0 +1,43 @@
+"""add llm cache
+
+Revision ID: 7b1d3e5f9a2c
+Revises: 4f2a9c7d1e3b
+Create Date: 2026-10-18 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+import models
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "7b1d3e5f9a2c"
+down_revision: Union[str, Sequence[str], None] = "4f2a9c7d1e3b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "llm_cache",
+        sa.Column("key", sa.String(length=64), nullable=False),
+        sa.Column("purpose", sa.String(), nullable=False),
+        sa.Column("vacancy_id", models.UUID(length=36), nullable=True),
+        sa.Column("value", sa.Text(), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("key"),
+    )
+    op.create_index(
+        op.f("ix_llm_cache_vacancy_id"), "llm_cache", ["vacancy_id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f("ix_llm_cache_vacancy_id"), table_name="llm_cache")
+    op.drop_table("llm_cache")
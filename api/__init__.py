@@ -6,3 +6,4 @@ from .resume import router as resume_router
 from .vacancy import router as vacancy_router
 from .candidate import router as candidate_router
 from .interview import router as interview_router
+from .health import router as health_router
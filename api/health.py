@@ -0,0 +1,50 @@
+from fastapi import APIRouter, status
+from fastapi.responses import JSONResponse
+
+from http_client import http_client
+from llm import llm_usage
+from rtc.admission import admission
+from rtc.latency import latency_metrics
+from rtc.registry import session_registry
+from rtc.tts import tts_cache, tts_executor
+
+router = APIRouter(tags=["health"])
+
+
+@router.get("/ready")
+async def ready():
+    if tts_executor.error is not None:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "error", "tts": False},
+        )
+    if not tts_executor.ready:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"status": "loading", "tts": False},
+        )
+    return {"status": "ready", "tts": True}
+
+
+@router.get("/capacity")
+async def capacity():
+    """Свободные места узла для балансировщика: 503, пока приём закрыт."""
+    content = {"worker_id": session_registry.worker_id, **admission.capacity()}
+    if not content["accepting"]:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content=content,
+            headers={"Retry-After": str(admission.retry_after)},
+        )
+    return content
+
+
+@router.get("/metrics")
+async def metrics():
+    return {
+        "tts": {"pending": tts_executor.pending, "cache": tts_cache.stats()},
+        "http": http_client.stats(),
+        "llm": llm_usage.stats(),
+        "admission": admission.capacity(),
+        "latency": latency_metrics.stats(),
+    }
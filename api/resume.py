@@ -21,11 +21,17 @@ from dependencies import (
     get_access_token_data,
     get_candidate_service,
     get_interview_service,
+    get_llm_cache_service,
     get_questions_service,
     get_resume_service,
 )
 from schemas import AccesTokenData, ResumeResponse
-from services import CandidateService, InterviewService, ResumeService
+from services import (
+    CandidateService,
+    InterviewService,
+    LLMCacheService,
+    ResumeService,
+)
 from services.questions_service import InterviewQuestionsService
 from use_cases import ResumeProcessUseCase
 
@@ -43,6 +49,7 @@ async def submit_candidate(
     questions_service: Annotated[
         InterviewQuestionsService, Depends(get_questions_service)
     ],
+    llm_cache_service: Annotated[LLMCacheService, Depends(get_llm_cache_service)],
     access_token_data: Annotated[AccesTokenData, Depends(get_access_token_data)],
     full_name: str = Form(...),
     email: str = Form(...),
@@ -76,6 +83,7 @@ async def submit_candidate(
         resume_service=resume_service,
         interview_service=interview_service,
         question_service=questions_service,
+        llm_cache=llm_cache_service,
         api_key=config.OPENROUTER_API_KEY,
     )
     asyncio.create_task(resume_process_uc.execute(resume_id=resume.id))
@@ -6,6 +6,9 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.responses import JSONResponse
 
 from dependencies import get_interview_service, get_questions_service
+from exceptions import AlreadyExistsError
+from rtc.admission import AdmissionTicket, admission
+from rtc.registry import session_registry
 from rtc.rtc import create_peer_connection
 from schemas import RTCOffer
 from schemas.interview import InterviewResultEnum
@@ -34,9 +37,42 @@ async def offer(
             detail="Interview is not available",
         )
 
-    questions = await questions_service.get_questions(interview_id)
-    welcome_text = await questions_service.get_welcome_text(interview_id)
+    # Интервью может идти только на одном воркере
+    owner = await session_registry.claim(interview_id)
+    if owner is not None:
+        raise AlreadyExistsError(f"Interview is already running on worker {owner}")
+
+    ticket: AdmissionTicket | None = None
+    released = False
+
+    async def release():
+        # Один раз на claim: повторный вызов удалил бы аренду новой сессии
+        nonlocal released
+        if released:
+            return
+        released = True
+        if ticket:
+            ticket.release()
+        await session_registry.release(interview_id)
+
+    try:
+        # При перегрузке узла ждёт в очереди или отвечает 503 с Retry-After
+        ticket = await admission.acquire()
+        questions = await questions_service.get_questions(interview_id)
+        welcome_text = await questions_service.get_welcome_text(interview_id)
+        welcome_audio = await questions_service.get_welcome_audio(interview_id)
+    except BaseException:
+        await release()
+        raise
+    # Дальше место и аренду освобождает сама сессия, после закрытия ресурсов
     answer = await create_peer_connection(
-        offer.sdp, offer.type, questions, welcome_text, interview_service, interview_id
+        offer.sdp,
+        offer.type,
+        questions,
+        welcome_text,
+        interview_service,
+        interview_id,
+        welcome_audio=welcome_audio,
+        on_close=release,
     )
     return JSONResponse(content=answer)
@@ -3,9 +3,13 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
-from dependencies import get_access_token_data, get_vacancy_service
+from dependencies import (
+    get_access_token_data,
+    get_llm_cache_service,
+    get_vacancy_service,
+)
 from schemas import AccesTokenData, VacancyCreate, VacancyResponse
-from services import VacancyService
+from services import LLMCacheService, VacancyService
 
 router = APIRouter(prefix="/api/vacancy", tags=["vacancy"])
 
@@ -44,3 +48,12 @@ async def get_vacancy(
             detail="Vacancy not found",
         )
     return res
+
+
+@router.delete("/{vacancy_id}/cache", status_code=status.HTTP_204_NO_CONTENT)
+async def invalidate_vacancy_cache(
+    vacancy_id: UUID,
+    access_token_data: Annotated[AccesTokenData, Depends(get_access_token_data)],
+    llm_cache_service: LLMCacheService = Depends(get_llm_cache_service),
+) -> None:
+    await llm_cache_service.invalidate_vacancy(vacancy_id)
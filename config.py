@@ -11,6 +11,12 @@ class LogLevels(str, Enum):
     CRITICAL = "CRITICAL"
 
 
+class STTBackends(str, Enum):
+    GLADIA = "gladia"
+    VOSK = "vosk"
+    SCRIPTED = "scripted"
+
+
 class Config(BaseSettings):
     GLADIA_API_KEY: str
     OPENROUTER_API_KEY: str
@@ -32,6 +38,69 @@ class Config(BaseSettings):
 
     LOG_LEVEL: LogLevels
 
+    TTS_DEVICE: str = "auto"
+    TTS_NUM_THREADS: int = 2
+    TTS_QUANTIZE: bool = False
+    TTS_SPEAKER: str = "xenia"
+    TTS_SAMPLE_RATE: int = 48000
+    TTS_STREAMING: bool = True
+    TTS_STREAM_MIN_CHARS: int = 40
+    TTS_STREAM_MAX_CHARS: int = 300
+    TTS_BUFFER_SECONDS: float = 10.0
+    TTS_WORKERS: int = 1
+    TTS_MAX_PENDING: int = 64
+    TTS_CACHE_MAX_MB: int = 256
+    TTS_CACHE_DIR: str | None = None
+    TTS_PRERENDER_TIMEOUT_S: float = 30.0
+
+    STT_BACKEND: STTBackends = STTBackends.GLADIA
+    STT_VOSK_MODEL_PATH: str = "models/vosk-model-small-ru"
+    STT_SCRIPT_PATH: str | None = None
+    STT_SCRIPT_LATENCY_MS: int = 150
+    STT_CHUNK_MS: int = 100
+    STT_BINARY_FRAMES: bool = True
+    STT_BACKLOG_MS: int = 5000
+    STT_POOL_SIZE: int = 0
+    STT_POOL_MAX_AGE_S: float = 60.0
+
+    TURN_MIN_SILENCE_MS: int = 400
+    TURN_MAX_SILENCE_MS: int = 1000
+    TURN_SPECULATIVE_SILENCE_MS: int = 200
+    LLM_SPECULATIVE: bool = True
+    LLM_STREAMING: bool = True
+    LLM_CONTEXT_BUDGET_TOKENS: int = 6000
+    LLM_CONTEXT_KEEP_TURNS: int = 4
+    LLM_CACHE_TTL_DAYS: int = 30
+    LLM_CACHE_QUESTIONS: bool = False
+    LLM_STRUCTURED_OUTPUT: bool = True
+    LLM_REPAIR_RETRIES: int = 1
+    BARGE_IN_ENABLED: bool = True
+    BARGE_IN_MIN_SPEECH_MS: int = 300
+
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE: int = 20
+    HTTP_KEEPALIVE_EXPIRY_S: float = 30.0
+    HTTP_HTTP2: bool = False
+    HTTP_CONNECT_TIMEOUT_S: float = 5.0
+    LLM_TIMEOUT_S: float = 60.0
+    SCREENING_TIMEOUT_S: float = 60.0
+    STT_INIT_TIMEOUT_S: float = 10.0
+
+    ADMISSION_MAX_SESSIONS: int = 10
+    ADMISSION_MAX_TTS_PENDING: int = 16
+    ADMISSION_MAX_LLM_IN_FLIGHT: int = 20
+    ADMISSION_MAX_QUEUE: int = 10
+    ADMISSION_QUEUE_TIMEOUT_S: float = 5.0
+    ADMISSION_RETRY_AFTER_S: int = 30
+
+    WORKER_ID: str | None = None
+    SESSION_REGISTRY_PATH: str = "run/sessions.db"
+    SESSION_LEASE_S: float = 30.0
+    RTC_CONNECT_TIMEOUT_S: float = 30.0
+    RTC_MAX_SESSION_S: float = 3600.0
+
+    LATENCY_SUMMARY_DIR: str | None = "run/latency"
+
     model_config = SettingsConfigDict(env_file=".env", extra="allow")
 
 
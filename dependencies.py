@@ -13,6 +13,7 @@ from services import (
     CandidateService,
     InterviewQuestionsService,
     InterviewService,
+    LLMCacheService,
     RefreshTokenService,
     ResumeService,
     UserService,
@@ -82,6 +83,14 @@ def get_vacancy_service(
     return VacancyService(session_factory)
 
 
+def get_llm_cache_service(
+    session_factory: Annotated[
+        async_sessionmaker[AsyncSession], Depends(get_async_session_factory)
+    ],
+) -> LLMCacheService:
+    return LLMCacheService(session_factory)
+
+
 def get_refresh_token_from_cookies(request: Request):
     refresh_token = request.cookies.get("refresh_token")
     if not refresh_token:
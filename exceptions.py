@@ -9,3 +9,9 @@ class NotFoundError(AppException):
 
 class AlreadyExistsError(AppException):
     pass
+
+
+class CapacityExceededError(AppException):
+    def __init__(self, message: str, retry_after: int) -> None:
+        super().__init__(message)
+        self.retry_after = retry_after
@@ -3,7 +3,7 @@ import logging
 from fastapi import Request, status
 from fastapi.responses import JSONResponse
 
-from exceptions import AlreadyExistsError, NotFoundError
+from exceptions import AlreadyExistsError, CapacityExceededError, NotFoundError
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +20,12 @@ def exception_handler(request: Request, exc: Exception):
                 content=str(exc),
                 status_code=status.HTTP_404_NOT_FOUND,
             )
+        case CapacityExceededError():
+            return JSONResponse(
+                content=str(exc),
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                headers={"Retry-After": str(exc.retry_after)},
+            )
         case _:
             logger.error("Unexpected api error:", exc_info=exc)
             return JSONResponse(
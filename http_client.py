@@ -0,0 +1,121 @@
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
+import httpx
+
+from config import config
+
+logger = logging.getLogger("http")
+
+
+class HTTPClientManager:
+    """
+    Общий httpx.AsyncClient приложения с пулом keep-alive соединений.
+
+    Клиент создаётся в lifespan и переиспользуется всеми внешними вызовами,
+    поэтому DNS, TCP и TLS выполняются один раз на соединение, а не на
+    запрос. У каждого места вызова свой бюджет времени и свои счётчики.
+    """
+
+    def __init__(self):
+        self.timeouts = {
+            "llm": config.LLM_TIMEOUT_S,
+            "screening": config.SCREENING_TIMEOUT_S,
+            "gladia": config.STT_INIT_TIMEOUT_S,
+        }
+        self._client: httpx.AsyncClient | None = None
+        self._stats = {
+            site: {"requests": 0, "errors": 0, "in_flight": 0, "total_s": 0.0}
+            for site in self.timeouts
+        }
+
+    def start(self):
+        if self._client is not None:
+            return
+        limits = httpx.Limits(
+            max_connections=config.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=config.HTTP_MAX_KEEPALIVE,
+            keepalive_expiry=config.HTTP_KEEPALIVE_EXPIRY_S,
+        )
+        try:
+            self._client = httpx.AsyncClient(limits=limits, http2=config.HTTP_HTTP2)
+        except ImportError:
+            logger.warning("HTTP/2 requires the h2 package, falling back to HTTP/1.1")
+            self._client = httpx.AsyncClient(limits=limits)
+
+    async def close(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # Вне lifespan (скрипты, бенчмарки) клиент создаётся при первом вызове
+        if self._client is None:
+            self.start()
+        return self._client  # type: ignore
+
+    def timeout(self, site: str) -> httpx.Timeout:
+        return httpx.Timeout(self.timeouts[site], connect=config.HTTP_CONNECT_TIMEOUT_S)
+
+    @asynccontextmanager
+    async def _track(self, site: str) -> AsyncIterator[dict]:
+        # Ответ 4xx/5xx тоже ошибка, даже если вызывающий код разберёт его
+        # сам; исключение после такого ответа не считается второй раз
+        stats = self._stats[site]
+        stats["requests"] += 1
+        stats["in_flight"] += 1
+        request = {"failed": False}
+        start = time.monotonic()
+        try:
+            yield request
+        except Exception:
+            request["failed"] = True
+            raise
+        finally:
+            stats["in_flight"] -= 1
+            stats["total_s"] += time.monotonic() - start
+            if request["failed"]:
+                stats["errors"] += 1
+
+    async def post(self, site: str, url: str, **kwargs) -> httpx.Response:
+        async with self._track(site) as request:
+            response = await self.client.post(url, timeout=self.timeout(site), **kwargs)
+            request["failed"] = response.status_code >= 400
+            return response
+
+    @asynccontextmanager
+    async def stream(
+        self, site: str, method: str, url: str, **kwargs
+    ) -> AsyncIterator[httpx.Response]:
+        async with self._track(site) as request:
+            async with self.client.stream(
+                method, url, timeout=self.timeout(site), **kwargs
+            ) as response:
+                request["failed"] = response.status_code >= 400
+                yield response
+
+    def in_flight(self, site: str) -> int:
+        return self._stats[site]["in_flight"]
+
+    def stats(self) -> dict:
+        pool = getattr(getattr(self._client, "_transport", None), "_pool", None)
+        connections = list(getattr(pool, "connections", []))
+        return {
+            "connections": len(connections),
+            "idle_connections": sum(1 for c in connections if c.is_idle()),
+            "sites": {
+                site: {
+                    "requests": s["requests"],
+                    "errors": s["errors"],
+                    "in_flight": s["in_flight"],
+                    "avg_s": s["total_s"] / s["requests"] if s["requests"] else 0.0,
+                }
+                for site, s in self._stats.items()
+            },
+        }
+
+
+http_client = HTTPClientManager()
@@ -1,3 +1,19 @@
 # flake8: noqa
 
-from .llm import get_response, get_system_instruction
+from .llm import (
+    build_payload,
+    get_interview_instructions,
+    get_response,
+    get_system_instruction,
+    payload_key,
+    request_key,
+)
+from .context import ConversationContext
+from .structured import (
+    get_structured,
+    parse_structured,
+    repair_structured,
+    response_format,
+)
+from .stream import InterviewReplyStream, stream_completion
+from .usage import llm_usage
@@ -0,0 +1,80 @@
+import asyncio
+import logging
+
+from config import config
+from resources.prompts import SUMMARY
+
+from .llm import MessageType, get_response, get_system_instruction
+
+logger = logging.getLogger("llm")
+
+
+def estimate_tokens(messages: list[MessageType]) -> int:
+    """Грубая оценка без токенизатора: ~3 символа русского текста на токен."""
+    return sum(len(m["content"]) // 3 + 4 for m in messages)
+
+
+class ConversationContext:
+    """
+    История интервью для запросов к LLM с ограничением по токенам.
+
+    Начальные сообщения (системный промпт, приветствие) и последние
+    keep_messages реплик передаются дословно, более старые реплики
+    заменяются кратким содержанием, которое обновляется в фоне.
+    Полная история остаётся в messages для подведения итогов.
+    """
+
+    def __init__(
+        self,
+        messages: list[MessageType],
+        budget_tokens: int = config.LLM_CONTEXT_BUDGET_TOKENS,
+        keep_messages: int = config.LLM_CONTEXT_KEEP_TURNS * 2,
+    ):
+        self.messages = [*messages]
+        self.head = len(messages)
+        self.budget_tokens = budget_tokens
+        self.keep_messages = keep_messages
+        self.summary = ""
+        self.summarized = self.head  # Реплики до этого индекса вошли в summary
+        self._task: asyncio.Task | None = None
+
+    def prompt(self) -> list[MessageType]:
+        messages = self.messages[: self.head]
+        if self.summary:
+            messages.append(
+                get_system_instruction(
+                    f"Краткое содержание предыдущей части интервью:\n{self.summary}"
+                )
+            )
+        return messages + self.messages[self.summarized :]
+
+    def add(self, *messages: MessageType):
+        self.messages.extend(messages)
+        if self._task is None and estimate_tokens(self.prompt()) > self.budget_tokens:
+            end = len(self.messages) - self.keep_messages
+            if end > self.summarized:
+                self._task = asyncio.create_task(self._compact(end))
+
+    async def _compact(self, end: int):
+        dialog = "\n".join(
+            f"{m['role']}: {m['content']}" for m in self.messages[self.summarized : end]
+        )
+        if self.summary:
+            dialog = f"Предыдущее краткое содержание:\n{self.summary}\n\n{dialog}"
+        try:
+            _, summary = await get_response(
+                [get_system_instruction(SUMMARY)],
+                dialog,
+                max_tokens=1000,
+                purpose="summary",
+            )
+            self.summary, self.summarized = summary.strip(), end
+            logger.info("Interview context compacted up to message %d", end)
+        except Exception as e:
+            logger.error("Context compaction failed", exc_info=e)
+        finally:
+            self._task = None
+
+    def close(self):
+        if self._task:
+            self._task.cancel()
@@ -1,8 +1,12 @@
+import hashlib
+import json
 from typing import TypedDict
 
-import httpx
-
 from config import config
+from http_client import http_client
+from resources.prompts import INTERVIEW
+
+from .usage import llm_usage
 
 API_KEY = config.OPENROUTER_API_KEY
 URL = "https://openrouter.ai/api/v1/chat/completions"
@@ -14,6 +18,9 @@ SYSTEM_INSTRUCTIONS = "Ты полезный ассистент. Отвечае
       разметки, кода и так далее. Ответ - 1-2 предложения. Все английские слова ты пишешь на русском.\
           Например Google - 'Гугл', docker - 'докер' "
 MODEL = "deepseek/deepseek-chat-v3.1"
+# Провайдеры, которым нужны явные точки кэширования промпта. Остальные
+# (DeepSeek, OpenAI) кэшируют совпадающий префикс автоматически.
+CACHE_CONTROL_PREFIXES = ("anthropic/", "google/")
 
 
 class MessageType(TypedDict):
@@ -25,25 +32,109 @@ def get_system_instruction(content: str) -> MessageType:
     return {"role": "system", "content": content}
 
 
-async def get_response(
-    src_messages: list[MessageType], user_text: str, max_tokens: int = 100
-) -> tuple[list[MessageType], str]:
+def get_interview_instructions(questions: list[str]) -> list[MessageType]:
+    """
+    Системная часть промпта интервью.
+
+    Неизменный текст INTERVIEW идёт первым, вопросы кандидата отдельным
+    сообщением после него, чтобы общий префикс кэшировался провайдером.
+    """
+    return [
+        get_system_instruction(INTERVIEW),
+        get_system_instruction("Вопросы для скрининга:\n" + "\n".join(questions)),
+    ]
+
+
+def build_messages(
+    src_messages: list[MessageType], user_text: str
+) -> list[MessageType]:
     if len(src_messages) == 0:
         messages: list[MessageType] = [get_system_instruction(SYSTEM_INSTRUCTIONS)]
     else:
         messages = src_messages.copy()
 
     messages.append({"role": "user", "content": user_text})
-    payload = {
+    return messages
+
+
+def with_cache_hints(messages: list[MessageType], model: str = MODEL) -> list[dict]:
+    """
+    Отметить точки кэширования в начальных системных сообщениях.
+
+    Первое сообщение — неизменные инструкции, общие для всех кандидатов,
+    последнее — конец системной части конкретного интервью, которая
+    повторяется на каждом ходе.
+    """
+    if not model.startswith(CACHE_CONTROL_PREFIXES):
+        return list(messages)
+    prefix = 0
+    while prefix < len(messages) and messages[prefix]["role"] == "system":
+        prefix += 1
+    marked = {0, prefix - 1} if prefix else set()
+    return [
+        (
+            {
+                "role": message["role"],
+                "content": [
+                    {
+                        "type": "text",
+                        "text": message["content"],
+                        "cache_control": {"type": "ephemeral"},
+                    }
+                ],
+            }
+            if i in marked
+            else message
+        )
+        for i, message in enumerate(messages)
+    ]
+
+
+def build_payload(
+    messages: list[MessageType], max_tokens: int, stream: bool = False, **extra
+) -> dict:
+    extra = {key: value for key, value in extra.items() if value is not None}
+    return {
         "model": MODEL,
-        "messages": messages,
-        "stream": False,
+        "messages": with_cache_hints(messages),
+        "stream": stream,
         "max_tokens": max_tokens,
+        # Ответ содержит число токенов промпта, из кэша и ответа
+        "usage": {"include": True},
+        **extra,
     }
-    async with httpx.AsyncClient() as client:
-        res = await client.post(URL, headers=HEADERS, json=payload, timeout=60)
-        res.raise_for_status()
-        answer: dict = res.json()["choices"][0]["message"]
-        messages.append({"role": answer["role"], "content": answer["content"]})
+
+
+def payload_key(payload: dict) -> str:
+    """Ключ кэша ответа: хэш модели, промпта, входных данных и параметров."""
+    return hashlib.sha256(
+        json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    ).hexdigest()
+
+
+def request_key(
+    src_messages: list[MessageType], user_text: str, max_tokens: int = 100, **extra
+) -> str:
+    """Ключ кэша для запроса, который выполнит get_response."""
+    return payload_key(
+        build_payload(build_messages(src_messages, user_text), max_tokens, **extra)
+    )
+
+
+async def get_response(
+    src_messages: list[MessageType],
+    user_text: str,
+    max_tokens: int = 100,
+    purpose: str = "chat",
+    response_format: dict | None = None,
+) -> tuple[list[MessageType], str]:
+    messages = build_messages(src_messages, user_text)
+    payload = build_payload(messages, max_tokens, response_format=response_format)
+    res = await http_client.post("llm", URL, headers=HEADERS, json=payload)
+    res.raise_for_status()
+    data = res.json()
+    llm_usage.record(purpose, data.get("usage"))
+    answer: dict = data["choices"][0]["message"]
+    messages.append({"role": answer["role"], "content": answer["content"]})
 
     return messages, answer["content"]
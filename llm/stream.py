@@ -0,0 +1,272 @@
+import asyncio
+import json
+import logging
+import re
+import time
+from typing import AsyncIterator
+
+from pydantic import ValidationError
+
+from config import config
+from schemas import InterviewReply
+from http_client import http_client
+
+from .llm import (
+    HEADERS,
+    URL,
+    MessageType,
+    build_messages,
+    build_payload,
+    get_response,
+)
+from .structured import parse_structured, repair_structured, response_format
+from .usage import llm_usage
+
+logger = logging.getLogger("llm")
+
+# Ответ, если реплику модели не удалось ни разобрать, ни исправить
+FALLBACK_REPLY = InterviewReply(
+    continue_interview=True,
+    answer="Извините, я не расслышала. Повторите, пожалуйста, ваш ответ.",
+)
+
+_ESCAPES = {"n": "\n", "t": "\t", "r": "\r", "b": "\b", "f": "\f"}
+
+
+def _hex(text: str) -> int | None:
+    try:
+        return int(text, 16)
+    except ValueError:
+        return None
+
+
+def _decode_unicode_escape(raw: str, i: int) -> tuple[str, int] | None:
+    """
+    Раскодировать \\uXXXX с позиции i, вернуть символ и следующую позицию
+    или None, если последовательность пришла не целиком.
+
+    Символы вне BMP приходят суррогатной парой из двух escape, одиночные
+    суррогаты заменяются на U+FFFD: их нельзя закодировать в UTF-8.
+    Битая последовательность выводится как есть и не обрывает ответ.
+    """
+    if i + 6 > len(raw):
+        return None
+    code = _hex(raw[i + 2 : i + 6])
+    if code is None:
+        return raw[i : i + 6], i + 6
+    if 0xD800 <= code < 0xDC00:
+        low = raw[i + 6 : i + 12]
+        if len(low) < 6 and "\\u".startswith(low[:2]):
+            return None
+        low_code = _hex(low[2:]) if low.startswith("\\u") else None
+        if low_code is not None and 0xDC00 <= low_code < 0xE000:
+            return chr(0x10000 + ((code - 0xD800) << 10) + low_code - 0xDC00), i + 12
+        return "\ufffd", i + 6
+    if 0xDC00 <= code < 0xE000:
+        return "\ufffd", i + 6
+    return chr(code), i + 6
+
+
+async def stream_completion(
+    messages: list[MessageType],
+    max_tokens: int = 100,
+    purpose: str = "chat",
+    response_format: dict | None = None,
+) -> AsyncIterator[str]:
+    """Запросить ответ с "stream": true и отдавать текст по мере генерации."""
+    payload = build_payload(
+        messages, max_tokens, stream=True, response_format=response_format
+    )
+    async with http_client.stream(
+        "llm", "POST", URL, headers=HEADERS, json=payload
+    ) as res:
+        res.raise_for_status()
+        async for line in res.aiter_lines():
+            # Строки-комментарии SSE (": OPENROUTER PROCESSING") пропускаются
+            if not line.startswith("data:"):
+                continue
+            data = line[5:].strip()
+            if data == "[DONE]":
+                break
+            chunk = json.loads(data)
+            # Статистика токенов приходит в последнем событии
+            llm_usage.record(purpose, chunk.get("usage"))
+            choices = chunk.get("choices") or [{}]
+            delta = choices[0].get("delta", {}).get("content")
+            if delta:
+                yield delta
+
+
+class JSONStringField:
+    """
+    Извлечение строкового поля JSON из ответа, который приходит по частям.
+
+    feed() возвращает новую раскодированную часть значения, как только она
+    пришла, не дожидаясь закрывающей кавычки и конца объекта.
+    """
+
+    def __init__(self, name: str):
+        self._start = re.compile(rf'"{name}"\s*:\s*"')
+        self._raw = ""
+        self._pos: int | None = None
+        self.text = ""
+        self.done = False
+
+    def feed(self, delta: str) -> str:
+        self._raw += delta
+        if self.done:
+            return ""
+        if self._pos is None:
+            match = self._start.search(self._raw)
+            if not match:
+                return ""
+            self._pos = match.end()
+
+        raw, i, out = self._raw, self._pos, []
+        while i < len(raw):
+            char = raw[i]
+            if char == '"':
+                self.done = True
+                i += 1
+                break
+            if char != "\\":
+                out.append(char)
+                i += 1
+                continue
+            # Экранированная последовательность может прийти не целиком
+            if i + 1 >= len(raw):
+                break
+            escape = raw[i + 1]
+            if escape == "u":
+                decoded = _decode_unicode_escape(raw, i)
+                if decoded is None:
+                    break
+                char, i = decoded
+                out.append(char)
+                continue
+            out.append(_ESCAPES.get(escape, escape))
+            i += 2
+
+        self._pos = i
+        segment = "".join(out)
+        self.text += segment
+        return segment
+
+
+def find_bool(raw: str, name: str) -> bool | None:
+    match = re.search(rf'"{name}"\s*:\s*(true|false)', raw)
+    return match.group(1) == "true" if match else None
+
+
+class InterviewReplyStream:
+    """
+    Потоковый ответ интервьюера вида {"continue_interview": ..., "answer": ...}.
+
+    Запрос выполняется фоновой задачей, поэтому его можно начать заранее
+    и отменить. segments() отдаёт текст поля answer по мере генерации,
+    флаг continue_interview доступен, как только модель его написала.
+    """
+
+    def __init__(
+        self, src_messages: list[MessageType], user_text: str, max_tokens: int = 100
+    ):
+        self.messages = build_messages(src_messages, user_text)
+        self.content = ""
+        self.answer = JSONStringField("answer")
+        self.continue_interview: bool | None = None
+        self._segments: asyncio.Queue[str | None] = asyncio.Queue()
+        # Моменты начала запроса, первого фрагмента и конца генерации
+        self.started_at = time.monotonic()
+        self.first_token_at: float | None = None
+        self.finished_at: float | None = None
+        self.task = asyncio.create_task(self._run(max_tokens))
+
+    async def _deltas(self, max_tokens: int) -> AsyncIterator[str]:
+        if config.LLM_STREAMING:
+            async for delta in stream_completion(
+                self.messages,
+                max_tokens,
+                purpose="interview",
+                response_format=response_format(InterviewReply),
+            ):
+                yield delta
+        else:
+            _, content = await get_response(
+                self.messages[:-1],
+                self.messages[-1]["content"],
+                max_tokens,
+                purpose="interview",
+                response_format=response_format(InterviewReply),
+            )
+            yield content
+
+    async def _run(self, max_tokens: int):
+        try:
+            async for delta in self._deltas(max_tokens):
+                if self.first_token_at is None:
+                    self.first_token_at = time.monotonic()
+                self.content += delta
+                if self.continue_interview is None:
+                    self.continue_interview = find_bool(
+                        self.content, "continue_interview"
+                    )
+                segment = self.answer.feed(delta)
+                if segment:
+                    self._segments.put_nowait(segment)
+            self.finished_at = time.monotonic()
+        finally:
+            self._segments.put_nowait(None)
+
+    async def segments(self) -> AsyncIterator[str]:
+        while (segment := await self._segments.get()) is not None:
+            yield segment
+        # Ошибка запроса пробрасывается потребителю
+        await self.task
+
+    async def wait(self) -> str:
+        await self.task
+        return self.content
+
+    async def result(self) -> InterviewReply:
+        """
+        Итоговый ответ после завершения генерации.
+
+        Если поле answer уже извлечено по ходу потока, повторный разбор не
+        нужен. Иначе ответ проверяется по схеме и при ошибке исправляется,
+        а content заменяется исправленным JSON для истории диалога.
+        """
+        content = await self.wait()
+        if self.answer.done and self.continue_interview is not None:
+            return InterviewReply(
+                continue_interview=self.continue_interview, answer=self.answer.text
+            )
+        try:
+            return parse_structured(InterviewReply, content)
+        except ValidationError as e:
+            try:
+                reply = await repair_structured(
+                    InterviewReply, content, e, 1000, "interview"
+                )
+            except Exception as e:
+                logger.error("Interview reply could not be repaired", exc_info=e)
+                reply = FALLBACK_REPLY
+        self.content = reply.model_dump_json()
+        return reply
+
+    def reply_message(self) -> MessageType:
+        """Ответ модели, при отмене — только уже сказанная часть."""
+        task = self.task
+        if task.done() and not task.cancelled() and task.exception() is None:
+            content = self.content
+        else:
+            content = json.dumps(
+                {"continue_interview": True, "answer": self.answer.text},
+                ensure_ascii=False,
+            )
+        return {"role": "assistant", "content": content}
+
+    def history(self) -> list[MessageType]:
+        return [*self.messages, self.reply_message()]
+
+    def cancel(self):
+        self.task.cancel()
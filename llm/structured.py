@@ -0,0 +1,95 @@
+import json
+import logging
+import re
+from typing import TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from config import config
+from resources.prompts import REPAIR
+
+from .llm import MessageType, get_response, get_system_instruction
+
+logger = logging.getLogger("llm")
+
+T = TypeVar("T", bound=BaseModel)
+
+_FENCE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+
+
+def response_format(model: type[BaseModel]) -> dict | None:
+    """Параметр response_format с JSON-схемой ответа."""
+    if not config.LLM_STRUCTURED_OUTPUT:
+        return None
+    return {
+        "type": "json_schema",
+        "json_schema": {
+            "name": model.__name__,
+            "strict": True,
+            "schema": model.model_json_schema(),
+        },
+    }
+
+
+def parse_structured(model: type[T], text: str) -> T:
+    """Разобрать ответ модели, допуская markdown-обёртку и текст вокруг JSON."""
+    match = _FENCE.search(text)
+    raw = match.group(1) if match else text.strip()
+    if not raw.startswith("{"):
+        start, end = raw.find("{"), raw.rfind("}")
+        if start != -1 and end > start:
+            raw = raw[start : end + 1]
+    return model.model_validate_json(raw)
+
+
+async def repair_structured(
+    model: type[T],
+    content: str,
+    error: ValidationError,
+    max_tokens: int,
+    purpose: str,
+) -> T:
+    """
+    Исправить невалидный ответ коротким запросом без исходного контекста.
+
+    Модели передаются только схема, ошибка и сам ответ, число попыток
+    ограничено LLM_REPAIR_RETRIES. После последней ошибки она пробрасывается.
+    """
+    schema = json.dumps(model.model_json_schema(), ensure_ascii=False)
+    for _ in range(config.LLM_REPAIR_RETRIES):
+        logger.warning("Invalid %s response, repairing: %s", purpose, error)
+        _, content = await get_response(
+            [get_system_instruction(REPAIR)],
+            f"Схема:\n{schema}\n\nОшибка:\n{error}\n\nОтвет:\n{content}",
+            max_tokens,
+            purpose=f"{purpose}_repair",
+            response_format=response_format(model),
+        )
+        try:
+            return parse_structured(model, content)
+        except ValidationError as e:
+            error = e
+    raise error
+
+
+async def get_structured(
+    src_messages: list[MessageType],
+    user_text: str,
+    model: type[T],
+    max_tokens: int = 100,
+    purpose: str = "chat",
+) -> tuple[list[MessageType], T]:
+    """get_response с ответом по JSON-схеме, проверкой и исправлением."""
+    messages, content = await get_response(
+        src_messages,
+        user_text,
+        max_tokens,
+        purpose=purpose,
+        response_format=response_format(model),
+    )
+    try:
+        return messages, parse_structured(model, content)
+    except ValidationError as e:
+        result = await repair_structured(model, content, e, max_tokens, purpose)
+        messages[-1] = {"role": "assistant", "content": result.model_dump_json()}
+        return messages, result
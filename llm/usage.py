@@ -0,0 +1,45 @@
+import logging
+from collections import defaultdict
+
+logger = logging.getLogger("llm")
+
+
+class LLMUsage:
+    """Счётчики токенов по назначению запроса: промпт, из кэша, ответ."""
+
+    def __init__(self):
+        self._stats: defaultdict[str, dict] = defaultdict(
+            lambda: {
+                "calls": 0,
+                "prompt_tokens": 0,
+                "cached_tokens": 0,
+                "completion_tokens": 0,
+                "cost": 0.0,
+            }
+        )
+
+    def record(self, purpose: str, usage: dict | None):
+        if not usage:
+            return
+        prompt = usage.get("prompt_tokens", 0)
+        cached = (usage.get("prompt_tokens_details") or {}).get("cached_tokens", 0)
+        completion = usage.get("completion_tokens", 0)
+        stats = self._stats[purpose]
+        stats["calls"] += 1
+        stats["prompt_tokens"] += prompt
+        stats["cached_tokens"] += cached
+        stats["completion_tokens"] += completion
+        stats["cost"] += usage.get("cost") or 0.0
+        logger.debug(
+            "LLM %s: prompt=%d cached=%d completion=%d",
+            purpose,
+            prompt,
+            cached,
+            completion,
+        )
+
+    def stats(self) -> dict:
+        return {purpose: dict(stats) for purpose, stats in self._stats.items()}
+
+
+llm_usage = LLMUsage()
@@ -7,6 +7,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 from api import (
     auth_router,
     candidate_router,
+    health_router,
     interview_router,
     resume_router,
     vacancy_router,
@@ -16,8 +17,12 @@ from config import config
 from database import create_tables
 from exceptions import AppException
 from exceptions_handler import exception_handler
+from http_client import http_client
 from logger import setup_logger
+from rtc.registry import session_registry
 from rtc.rtc import shutdown
+from rtc.stt import check_stt_backend, gladia_pool
+from rtc.tts import tts_executor
 
 setup_logger()
 
@@ -41,8 +46,16 @@ async def startup_event(app: FastAPI):
 
     await create_tables(engine)
     app.state.session_factory = AsyncSessionLocal
+    http_client.start()
+    # Модель TTS грузится в фоне, готовность видна на /ready
+    tts_executor.start()
+    check_stt_backend()
+    gladia_pool.start()
+    session_registry.start()
     yield
     await shutdown()
+    await session_registry.stop()
+    await http_client.close()
 
 
 app = FastAPI(
@@ -72,4 +85,5 @@ app.include_router(candidate_router)
 app.include_router(vacancy_router)
 app.include_router(resume_router)
 app.include_router(interview_router)
+app.include_router(health_router)
 app.add_exception_handler(AppException, exception_handler)
@@ -4,7 +4,16 @@ import uuid
 from datetime import datetime, timezone
 from uuid import uuid4
 
-from sqlalchemy import DateTime, Enum, ForeignKey, String, Text, TypeDecorator
+from sqlalchemy import (
+    DateTime,
+    Enum,
+    ForeignKey,
+    Integer,
+    LargeBinary,
+    String,
+    Text,
+    TypeDecorator,
+)
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 from schemas import (
@@ -206,3 +215,20 @@ class InterviewQuestions(Base):
     )
     text: Mapped[str] = mapped_column(String)
     welcome_text: Mapped[str] = mapped_column(String)
+    welcome_audio: Mapped[bytes | None] = mapped_column(LargeBinary, nullable=True)
+    welcome_sample_rate: Mapped[int | None] = mapped_column(Integer, nullable=True)
+
+
+class LLMCacheOrm(Base):
+    __tablename__ = "llm_cache"
+
+    key: Mapped[str] = mapped_column(String(64), primary_key=True)
+    purpose: Mapped[str] = mapped_column(String, nullable=False)
+    vacancy_id: Mapped[uuid.UUID | None] = mapped_column(
+        UUID(), nullable=True, index=True
+    )
+    value: Mapped[str] = mapped_column(Text, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), default=lambda: datetime.now(timezone.utc)
+    )
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True))
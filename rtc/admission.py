@@ -0,0 +1,118 @@
+import asyncio
+import logging
+import time
+
+from config import config
+from exceptions import CapacityExceededError
+from http_client import http_client
+from rtc.tts import tts_executor
+
+logger = logging.getLogger("admission")
+
+
+class AdmissionTicket:
+    """Место интервью на узле, освобождается ровно один раз."""
+
+    def __init__(self, controller: "AdmissionController"):
+        self._controller = controller
+        self.released = False
+
+    def release(self):
+        if not self.released:
+            self.released = True
+            self._controller._release()
+
+
+class AdmissionController:
+    """
+    Допуск новых интервью на узел.
+
+    Новое подключение принимается, только если число активных сессий,
+    очередь TTS и число запросов к LLM ниже порогов. Пороги TTS и LLM
+    ниже их жёстких лимитов, чтобы запас оставался идущим интервью.
+    При перегрузке запрос ждёт в ограниченной очереди не дольше
+    queue_timeout, после чего получает отказ с подсказкой Retry-After.
+    """
+
+    def __init__(
+        self,
+        max_sessions: int = config.ADMISSION_MAX_SESSIONS,
+        max_tts_pending: int = config.ADMISSION_MAX_TTS_PENDING,
+        max_llm_in_flight: int = config.ADMISSION_MAX_LLM_IN_FLIGHT,
+        max_queue: int = config.ADMISSION_MAX_QUEUE,
+        queue_timeout: float = config.ADMISSION_QUEUE_TIMEOUT_S,
+        retry_after: int = config.ADMISSION_RETRY_AFTER_S,
+    ):
+        self.max_sessions = max_sessions
+        self.max_tts_pending = max_tts_pending
+        self.max_llm_in_flight = max_llm_in_flight
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.retry_after = retry_after
+        self.active = 0
+        self.waiting = 0
+        self.rejected = 0
+        self._released = asyncio.Event()
+
+    def saturation(self) -> str | None:
+        """Вернуть причину перегрузки или None, если узел свободен."""
+        if self.active >= self.max_sessions:
+            return "sessions"
+        if tts_executor.pending >= self.max_tts_pending:
+            return "tts"
+        if http_client.in_flight("llm") >= self.max_llm_in_flight:
+            return "llm"
+        return None
+
+    async def acquire(self) -> AdmissionTicket:
+        reason = self.saturation()
+        if reason is not None and self.waiting < self.max_queue:
+            deadline = time.monotonic() + self.queue_timeout
+            self.waiting += 1
+            try:
+                while reason is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    # Очереди TTS и LLM убывают без событий, поэтому ждём
+                    # освобождения сессии, но не дольше полсекунды
+                    released = self._released
+                    try:
+                        await asyncio.wait_for(released.wait(), min(remaining, 0.5))
+                    except asyncio.TimeoutError:
+                        pass
+                    reason = self.saturation()
+            finally:
+                self.waiting -= 1
+
+        if reason is not None:
+            self.rejected += 1
+            logger.warning("Interview rejected, node saturated by %s", reason)
+            raise CapacityExceededError(
+                f"Server is busy ({reason}), retry later",
+                retry_after=self.retry_after,
+            )
+        self.active += 1
+        return AdmissionTicket(self)
+
+    def _release(self):
+        self.active -= 1
+        # Будим всех ожидающих, свободное место займёт первый проснувшийся
+        self._released.set()
+        self._released = asyncio.Event()
+
+    def capacity(self) -> dict:
+        return {
+            "accepting": self.saturation() is None,
+            "active_sessions": self.active,
+            "max_sessions": self.max_sessions,
+            "waiting": self.waiting,
+            "rejected": self.rejected,
+            "tts_pending": tts_executor.pending,
+            "max_tts_pending": self.max_tts_pending,
+            "llm_in_flight": http_client.in_flight("llm"),
+            "max_llm_in_flight": self.max_llm_in_flight,
+        }
+
+
+admission = AdmissionController()
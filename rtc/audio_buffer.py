@@ -0,0 +1,43 @@
+import numpy as np
+
+
+class AudioRingBuffer:
+    """Кольцевой буфер int16 PCM с заранее выделенной памятью."""
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self._data = np.zeros(capacity, dtype=np.int16)
+        self._start = 0
+        self._size = 0
+
+    @property
+    def size(self) -> int:
+        return self._size
+
+    @property
+    def free(self) -> int:
+        return self.capacity - self._size
+
+    def write(self, samples: np.ndarray) -> int:
+        """Записать сколько поместится, вернуть число записанных сэмплов."""
+        count = min(len(samples), self.free)
+        end = (self._start + self._size) % self.capacity
+        first = min(count, self.capacity - end)
+        self._data[end : end + first] = samples[:first]
+        self._data[: count - first] = samples[first:count]
+        self._size += count
+        return count
+
+    def read_into(self, out: np.ndarray) -> int:
+        """Скопировать до len(out) сэмплов в out, вернуть их число."""
+        count = min(len(out), self._size)
+        first = min(count, self.capacity - self._start)
+        out[:first] = self._data[self._start : self._start + first]
+        out[first:count] = self._data[: count - first]
+        self._start = (self._start + count) % self.capacity
+        self._size -= count
+        return count
+
+    def clear(self):
+        self._start = 0
+        self._size = 0
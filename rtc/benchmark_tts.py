@@ -0,0 +1,69 @@
+"""
+Замер скорости синтеза речи в разных режимах.
+
+Запуск: python -m rtc.benchmark_tts --mode cpu --mode cpu-int8 --mode cuda
+
+RTF (real-time factor) = время синтеза / длительность аудио,
+значения меньше 1 означают синтез быстрее реального времени.
+"""
+
+import argparse
+import time
+
+import torch
+
+from rtc.tts import TTS_SAMPLE_RATE, load_tts_model, synthesize_tts
+
+SAMPLE_RATE = TTS_SAMPLE_RATE
+
+PHRASES = [
+    "Здравствуйте! Меня зовут Ксения, сегодня я проведу с вами техническое интервью.",
+    "Расскажите, пожалуйста, о вашем опыте работы с докером и кубернетисом.",
+    "Спасибо за ответ. Как вы организуете миграции базы данных в продакшене?",
+    "Хорошо.",
+]
+
+MODES = {
+    "cpu": ("cpu", False),
+    "cpu-int8": ("cpu", True),
+    "cuda": ("cuda", False),
+}
+
+
+def run(mode: str, threads: int, repeats: int) -> tuple[float, float, float]:
+    device, quantize = MODES[mode]
+    model = load_tts_model(device_name=device, quantize=quantize, num_threads=threads)
+    # Прогрев: первые вызовы включают компиляцию и инициализацию ядер
+    synthesize_tts(model, PHRASES[0], SAMPLE_RATE)
+
+    synth_time, audio_time = 0.0, 0.0
+    with torch.inference_mode():
+        for _ in range(repeats):
+            for phrase in PHRASES:
+                start = time.perf_counter()
+                audio = synthesize_tts(model, phrase, SAMPLE_RATE)
+                synth_time += time.perf_counter() - start
+                audio_time += len(audio) / SAMPLE_RATE
+    return synth_time, audio_time, synth_time / audio_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--mode", action="append", choices=list(MODES))
+    parser.add_argument("--threads", type=int, default=2)
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    modes = args.mode or ["cpu", "cpu-int8"]
+    if "cuda" in modes and not torch.cuda.is_available():
+        print("CUDA is not available, skipping cuda mode")
+        modes.remove("cuda")
+
+    print(f"{'mode':<10} {'synth, s':>10} {'audio, s':>10} {'RTF':>8}")
+    for mode in modes:
+        synth_time, audio_time, rtf = run(mode, args.threads, args.repeats)
+        print(f"{mode:<10} {synth_time:>10.2f} {audio_time:>10.2f} {rtf:>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import asyncio
+import logging
+
+from llm import get_structured, get_system_instruction
+from resources.prompts import RESULT, TURN_SCORE
+from schemas import AnswerScore, InterviewVerdict
+
+logger = logging.getLogger("evaluator")
+
+# Средний балл, начиная с которого кандидат проходит, если итоговый запрос не удался
+PASS_SCORE = 6
+
+
+class InterviewEvaluator:
+    """
+    Оценка интервью по ходу разговора.
+
+    Каждый ответ кандидата оценивается в фоне сразу после своей реплики,
+    поэтому к концу звонка остаётся один короткий запрос, который сводит
+    готовые оценки в итог. Ответы, оценить которые не удалось, попадают
+    в итоговый запрос дословно.
+    """
+
+    def __init__(self):
+        self.turns: list[tuple[str, str]] = []
+        self.scores: list[AnswerScore | None] = []
+        self._tasks: list[asyncio.Task] = []
+
+    def add_turn(self, question: str, answer: str):
+        self.turns.append((question, answer))
+        self.scores.append(None)
+        self._tasks.append(
+            asyncio.create_task(self._score(len(self.turns) - 1, question, answer))
+        )
+
+    def cancel(self):
+        """Отменить оценку ответов, если итог уже не понадобится."""
+        for task in self._tasks:
+            task.cancel()
+
+    async def _score(self, index: int, question: str, answer: str):
+        try:
+            _, self.scores[index] = await get_structured(
+                [get_system_instruction(TURN_SCORE)],
+                f"Вопрос: {question}\nОтвет: {answer}",
+                AnswerScore,
+                max_tokens=500,
+                purpose="turn_score",
+            )
+        except Exception as e:
+            logger.error("Failed to score answer %d", index, exc_info=e)
+
+    def _report(self) -> str:
+        lines = []
+        for (question, answer), score in zip(self.turns, self.scores):
+            if score is None:
+                lines.append(f"Вопрос: {question}\nОтвет без оценки: {answer}")
+                continue
+            evidence = "; ".join(f"«{quote}»" for quote in score.evidence)
+            lines.append(
+                f"Тема: {score.topic}\nБалл: {score.score}\n"
+                f"Цитаты: {evidence or 'нет'}\nКомментарий: {score.comment}"
+            )
+        return "\n\n".join(lines)
+
+    def _fallback(self) -> InterviewVerdict:
+        scored = [score for score in self.scores if score is not None]
+        average = sum(s.score for s in scored) / len(scored) if scored else 0
+        return InterviewVerdict(
+            hr_feedback="\n".join(
+                f"{s.topic}: {s.score}/10. {s.comment}" for s in scored
+            ),
+            candidate_feedback="Спасибо за участие в интервью!",
+            status="PASSED" if average >= PASS_SCORE else "REJECTED",
+        )
+
+    async def compose(self) -> InterviewVerdict:
+        """Дождаться оценок всех ответов и составить итог."""
+        await asyncio.gather(*self._tasks)
+        try:
+            _, verdict = await get_structured(
+                [get_system_instruction(RESULT)],
+                self._report(),
+                InterviewVerdict,
+                max_tokens=1500,
+                purpose="result",
+            )
+            return verdict
+        except Exception as e:
+            # Уже полученные оценки не теряются из-за сбоя итогового запроса
+            logger.error("Failed to compose interview result", exc_info=e)
+            return self._fallback()
@@ -0,0 +1,145 @@
+import json
+import logging
+import time
+from bisect import bisect_left
+from pathlib import Path
+from uuid import UUID
+
+logger = logging.getLogger("latency")
+
+# Отрезки реплики: (начало, конец) по меткам TurnTimeline
+LATENCY_SPANS = {
+    "stt_final": ("speech_end", "final_transcript"),
+    "turn_detect": ("speech_end", "turn_end"),
+    "llm_first_token": ("llm_start", "llm_first_token"),
+    "llm_total": ("llm_start", "llm_finish"),
+    "tts_total": ("tts_start", "tts_finish"),
+    "tts_first_audio": ("tts_start", "first_audio"),
+    "response": ("speech_end", "first_audio"),
+}
+
+BUCKETS_MS = (50, 100, 200, 300, 500, 750, 1000, 1500, 2000, 3000, 5000, 10000)
+
+
+class TurnTimeline:
+    """
+    Метки времени одной реплики по time.monotonic().
+
+    speech_end — последний кадр речи кандидата, turn_end — решение о конце
+    реплики. Спекулятивный запрос к LLM может начаться раньше turn_end.
+    Повторная метка с тем же именем игнорируется.
+    """
+
+    def __init__(self):
+        self.marks: dict[str, float] = {}
+
+    def mark(self, name: str, at: float | None = None):
+        if name not in self.marks:
+            self.marks[name] = time.monotonic() if at is None else at
+
+    def spans(self) -> dict[str, float]:
+        return {
+            span: (self.marks[end] - self.marks[start]) * 1000
+            for span, (start, end) in LATENCY_SPANS.items()
+            if start in self.marks and end in self.marks
+        }
+
+    def summary(self) -> dict:
+        origin = self.marks.get("speech_end") or min(self.marks.values(), default=0)
+        return {
+            "marks_ms": {
+                name: round((at - origin) * 1000, 1)
+                for name, at in sorted(self.marks.items(), key=lambda m: m[1])
+            },
+            "spans_ms": {span: round(ms, 1) for span, ms in self.spans().items()},
+        }
+
+
+class LatencyHistogram:
+    def __init__(self):
+        self.counts = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.total = 0.0
+
+    def observe(self, ms: float):
+        self.counts[bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.total += ms
+
+    def quantile(self, q: float) -> int | str | None:
+        # Верхняя граница корзины, в которую попал квантиль; inf не
+        # сериализуется в JSON, поэтому последняя корзина — строкой
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(BUCKETS_MS, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return f">{BUCKETS_MS[-1]}"
+
+    def stats(self) -> dict:
+        return {
+            "count": self.count,
+            "avg_ms": self.total / self.count if self.count else 0.0,
+            "p50_ms": self.quantile(0.5),
+            "p95_ms": self.quantile(0.95),
+            "buckets": {
+                **{f"le_{b}": c for b, c in zip(BUCKETS_MS, self.counts)},
+                "inf": self.counts[-1],
+            },
+        }
+
+
+class LatencyMetrics:
+    """Гистограммы задержек по отрезкам реплик всех интервью процесса."""
+
+    def __init__(self):
+        self._histograms = {span: LatencyHistogram() for span in LATENCY_SPANS}
+
+    def record(self, timeline: TurnTimeline):
+        for span, ms in timeline.spans().items():
+            self._histograms[span].observe(ms)
+
+    def stats(self) -> dict:
+        return {span: h.stats() for span, h in self._histograms.items()}
+
+
+latency_metrics = LatencyMetrics()
+
+
+def interview_summary(interview_id: UUID, timelines: list[TurnTimeline]) -> dict:
+    turns = [timeline.summary() for timeline in timelines]
+    spans: dict[str, list[float]] = {}
+    for turn in turns:
+        for span, ms in turn["spans_ms"].items():
+            spans.setdefault(span, []).append(ms)
+    return {
+        "interview_id": str(interview_id),
+        "turns": turns,
+        "spans_ms": {
+            span: {
+                "avg": round(sum(values) / len(values), 1),
+                "max": max(values),
+            }
+            for span, values in spans.items()
+        },
+    }
+
+
+def write_summary(summary_dir: str | None, summary: dict):
+    """Записать сводку интервью в <summary_dir>/<interview_id>.json."""
+    response = summary["spans_ms"].get("response")
+    logger.info(
+        "Interview %s latency: %d turns, response avg %s ms, max %s ms",
+        summary["interview_id"],
+        len(summary["turns"]),
+        response and response["avg"],
+        response and response["max"],
+    )
+    if not summary_dir:
+        return
+    path = Path(summary_dir) / f"{summary['interview_id']}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(summary, ensure_ascii=False, indent=2))
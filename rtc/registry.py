@@ -0,0 +1,173 @@
+import asyncio
+import logging
+import os
+import socket
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator
+from uuid import UUID
+
+from config import config
+
+logger = logging.getLogger("registry")
+
+WORKER_ID = config.WORKER_ID or f"{socket.gethostname()}:{os.getpid()}"
+
+
+class SessionRegistry(ABC):
+    """
+    Реестр владельцев интервью между воркерами.
+
+    Интервью может идти только на одном воркере: claim() выдаёт аренду
+    на lease_s секунд, воркер продлевает аренды своих сессий в фоне.
+    Если воркер упал, его аренды истекают и интервью можно открыть заново.
+    Сетевое хранилище (Redis, общая БД) подключается реализацией этого
+    интерфейса с атомарным claim().
+    """
+
+    def __init__(self, lease_s: float, worker_id: str = WORKER_ID):
+        self.lease_s = lease_s
+        self.worker_id = worker_id
+        self._owned: set[UUID] = set()
+        self._task: asyncio.Task | None = None
+
+    async def claim(self, interview_id: UUID) -> str | None:
+        """Занять интервью, вернуть id воркера-владельца при конфликте."""
+        owner = await self._claim(interview_id, time.time() + self.lease_s)
+        if owner is None:
+            self._owned.add(interview_id)
+        return owner
+
+    async def release(self, interview_id: UUID):
+        self._owned.discard(interview_id)
+        try:
+            await self._release(interview_id)
+        except Exception as e:
+            logger.error("Failed to release interview %s", interview_id, exc_info=e)
+
+    def start(self):
+        if self._task is None:
+            self._task = asyncio.create_task(self._renew_loop())
+
+    async def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        for interview_id in list(self._owned):
+            await self.release(interview_id)
+
+    async def _renew_loop(self):
+        while True:
+            await asyncio.sleep(self.lease_s / 3)
+            if not self._owned:
+                continue
+            try:
+                await self._renew(list(self._owned), time.time() + self.lease_s)
+            except Exception as e:
+                logger.error("Failed to renew session leases", exc_info=e)
+
+    @abstractmethod
+    async def _claim(self, interview_id: UUID, expires_at: float) -> str | None: ...
+
+    @abstractmethod
+    async def _release(self, interview_id: UUID): ...
+
+    @abstractmethod
+    async def _renew(self, interview_ids: list[UUID], expires_at: float): ...
+
+    @abstractmethod
+    async def owners(self) -> dict[str, str]: ...
+
+
+class SQLiteSessionRegistry(SessionRegistry):
+    """Реестр в локальном файле SQLite для воркеров одного хоста."""
+
+    def __init__(self, path: str, lease_s: float, worker_id: str = WORKER_ID):
+        super().__init__(lease_s, worker_id)
+        self.path = path
+        self._initialized = False
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        if not self._initialized:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+        try:
+            if not self._initialized:
+                self._init_schema(conn)
+            yield conn
+        finally:
+            conn.close()
+
+    def _init_schema(self, conn: sqlite3.Connection):
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute(
+            "CREATE TABLE IF NOT EXISTS sessions ("
+            "interview_id TEXT PRIMARY KEY, worker_id TEXT NOT NULL, "
+            "expires_at REAL NOT NULL)"
+        )
+        self._initialized = True
+
+    def _claim_sync(self, interview_id: str, expires_at: float) -> str | None:
+        with self._connect() as conn:
+            # IMMEDIATE берёт блокировку записи, проверка и вставка атомарны
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT worker_id FROM sessions "
+                "WHERE interview_id = ? AND expires_at > ?",
+                (interview_id, time.time()),
+            ).fetchone()
+            if row is not None:
+                conn.execute("ROLLBACK")
+                return row[0]
+            conn.execute(
+                "INSERT OR REPLACE INTO sessions VALUES (?, ?, ?)",
+                (interview_id, self.worker_id, expires_at),
+            )
+            conn.execute("COMMIT")
+            return None
+
+    def _release_sync(self, interview_id: str):
+        with self._connect() as conn:
+            conn.execute(
+                "DELETE FROM sessions WHERE interview_id = ? AND worker_id = ?",
+                (interview_id, self.worker_id),
+            )
+
+    def _renew_sync(self, interview_ids: list[str], expires_at: float):
+        with self._connect() as conn:
+            conn.executemany(
+                "UPDATE sessions SET expires_at = ? "
+                "WHERE interview_id = ? AND worker_id = ?",
+                [(expires_at, i, self.worker_id) for i in interview_ids],
+            )
+
+    def _owners_sync(self) -> dict[str, str]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT interview_id, worker_id FROM sessions WHERE expires_at > ?",
+                (time.time(),),
+            ).fetchall()
+        return dict(rows)
+
+    async def _claim(self, interview_id: UUID, expires_at: float) -> str | None:
+        return await asyncio.to_thread(self._claim_sync, str(interview_id), expires_at)
+
+    async def _release(self, interview_id: UUID):
+        await asyncio.to_thread(self._release_sync, str(interview_id))
+
+    async def _renew(self, interview_ids: list[UUID], expires_at: float):
+        await asyncio.to_thread(
+            self._renew_sync, [str(i) for i in interview_ids], expires_at
+        )
+
+    async def owners(self) -> dict[str, str]:
+        return await asyncio.to_thread(self._owners_sync)
+
+
+session_registry: SessionRegistry = SQLiteSessionRegistry(
+    config.SESSION_REGISTRY_PATH, config.SESSION_LEASE_S
+)
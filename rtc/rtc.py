@@ -1,77 +1,123 @@
 import asyncio
-import base64
 import json
 import logging
-import re
 import time
+from collections import deque
 from datetime import datetime, timezone
 from fractions import Fraction
-from typing import Any, Set
+from typing import AsyncIterator, Awaitable, Callable, Set
 from uuid import UUID
 
-import httpx
 import numpy as np
-import torch
 import webrtcvad
-import websockets
 from aiortc import MediaStreamTrack, RTCPeerConnection, RTCSessionDescription
 from aiortc.contrib.media import MediaRelay
 from av import AudioFrame, AudioResampler
-from scipy.signal import resample
 
 from config import config
-from llm import get_response, get_system_instruction
-from resources.prompts import INTERVIEW, RESULT
+from llm import (
+    ConversationContext,
+    InterviewReplyStream,
+    get_interview_instructions,
+    get_system_instruction,
+)
+from rtc.audio_buffer import AudioRingBuffer
+from rtc.evaluator import InterviewEvaluator
+from rtc.latency import TurnTimeline, interview_summary, latency_metrics, write_summary
+from rtc.stt import create_stt_backend, shutdown_stt
+from rtc.turn import FRAME_MS, TurnDetector
+from rtc.tts import TTS_SAMPLE_RATE, SentenceStream, tts_chunks, tts_executor
+from schemas import InterviewReply, InterviewResultEnum
 from services import InterviewService
 
 logger = logging.getLogger("webrtc")
 
 pcs: Set[RTCPeerConnection] = set()
 relay = MediaRelay()
-tts_model, _ = torch.hub.load(
-    repo_or_dir="snakers4/silero-models",
-    model="silero_tts",
-    language="ru",
-    speaker="v4_ru",
-)  # type: ignore
-tts_model.to(torch.device("cuda"))
-
-
-def parse_llm_json(llm_output: str) -> Any:
-    pattern = r"```(?:json)?\s*(.*?)\s*```"
-    match = re.search(pattern, llm_output, re.DOTALL)
-
-    if match:
-        json_str = match.group(1)
-    else:
-        json_str = llm_output.strip()
+
+# Прощание на случай, если модель завершила интервью с пустым ответом
+FAREWELL = "Спасибо за интервью! Результаты мы сообщим вам позже. До свидания!"
+
+
+async def enqueue_tts(
+    tts_track: "TTSAudioTrack", text: str, timeline: TurnTimeline | None = None
+):
+    """
+    Синтезировать текст и передать аудио в TTSAudioTrack.
+
+    В потоковом режиме каждая фраза попадает в очередь сразу после синтеза,
+    и трек начинает играть первую, пока синтезируются следующие.
+    """
+    if timeline:
+        timeline.mark("tts_start")
+    for chunk in tts_chunks(text):
+        await tts_track.play(await tts_executor.synthesize(chunk))
+    if timeline:
+        timeline.mark("tts_finish")
+
+
+async def enqueue_tts_stream(
+    tts_track: "TTSAudioTrack",
+    segments: AsyncIterator[str],
+    timeline: TurnTimeline | None = None,
+):
+    """
+    Озвучивать ответ LLM по мере генерации.
+
+    Синтез каждой фразы начинается сразу, как только она дописана моделью,
+    а воспроизведение идёт по порядку в отдельной задаче.
+    """
+    sentences = SentenceStream()
+    synth: asyncio.Queue[asyncio.Task | None] = asyncio.Queue()
+
+    async def playback():
+        while (task := await synth.get()) is not None:
+            await tts_track.play(await task)
+
+    player = asyncio.create_task(playback())
+    tasks: list[asyncio.Task] = []
+
+    def submit(chunk: str):
+        if timeline:
+            timeline.mark("tts_start")
+        tasks.append(asyncio.create_task(tts_executor.synthesize(chunk)))
+        synth.put_nowait(tasks[-1])
+
     try:
-        return json.loads(json_str)
-    except json.JSONDecodeError as e:
-        logger.critical(f"error parsing llm answer {llm_output}", exc_info=e)
-        return "ошибка("
+        async for segment in segments:
+            for chunk in sentences.feed(segment):
+                submit(chunk)
+        for chunk in sentences.close():
+            submit(chunk)
+        synth.put_nowait(None)
+        await asyncio.gather(*tasks)
+        if timeline:
+            timeline.mark("tts_finish")
+        await player
+    finally:
+        player.cancel()
+        for task in tasks:
+            task.cancel()
+
+
+async def prepend(first: str, segments: AsyncIterator[str]) -> AsyncIterator[str]:
+    yield first
+    async for segment in segments:
+        yield segment
 
 
 async def set_result(
-    messages: list, interview_service: InterviewService, interview_id: UUID
+    evaluator: InterviewEvaluator,
+    interview_service: InterviewService,
+    interview_id: UUID,
 ):
-    res = parse_llm_json(
-        (
-            await get_response(
-                src_messages=[get_system_instruction(RESULT)],
-                user_text="\n".join(
-                    [f"{i['role']}: {i['content']}" for i in messages[2:]]
-                ),
-                max_tokens=5000,
-            )
-        )[1]
-    )
+    verdict = await evaluator.compose()
     await interview_service.update(
         id=interview_id,
         passed_at=datetime.now(timezone.utc),
-        result=res["status"],
-        feedback_hr=res["hr_feedback"],
-        feedback_candidate=res["candidate_feedback"],
+        result=InterviewResultEnum[verdict.status],
+        feedback_hr=verdict.hr_feedback,
+        feedback_candidate=verdict.candidate_feedback,
     )
 
 
@@ -79,82 +125,84 @@ class AudioProcessor:
 
     def __init__(
         self,
-        tts_queue: asyncio.Queue,
+        tts_track: "TTSAudioTrack",
         messages: list,
         pc: RTCPeerConnection,
         interview_service: InterviewService,
         interview_id: UUID,
     ):
         self.resampler = AudioResampler(format="s16", layout="mono", rate=16000)
-        self.ws: websockets.ClientConnection | None = None
-        self.tts_queue = tts_queue
+        self.stt = create_stt_backend(self._on_transcript)
+        self.tts_track = tts_track
         self.vad = webrtcvad.Vad(2)
-        self.silence_frames = 0
-        self.max_silence_frames = 50  # 50 * 20мс = 1 сек тишины → конец utterance
+        self.turn = TurnDetector(
+            min_silence_ms=config.TURN_MIN_SILENCE_MS,
+            max_silence_ms=config.TURN_MAX_SILENCE_MS,
+        )
         self.text_buffer = []  # Буфер для накопления текста
-        self.is_waiting_response = asyncio.Event()
-        self.messages = [*messages]
+        self.partial_text = ""  # Ещё не финальная расшифровка текущей фразы
+        # Спекулятивный запрос к LLM, начатый на короткой паузе
+        self.speculation: InterviewReplyStream | None = None
+        self.speculation_text = ""
+        self.speculative_frames = config.TURN_SPECULATIVE_SILENCE_MS // FRAME_MS
+        self.response_task: asyncio.Task | None = None
+        self.result_task: asyncio.Task | None = None
+        self.closing = False
+        self.min_barge_in_frames = config.BARGE_IN_MIN_SPEECH_MS // FRAME_MS
+        # Последние кадры кандидата во время ответа бота: при перебивании
+        # они уходят в STT, чтобы не потерять начало фразы
+        self.preroll: deque[np.ndarray] = deque(maxlen=self.min_barge_in_frames)
+        self.context = ConversationContext(messages)
+        self.evaluator = InterviewEvaluator()
+        # Реплика бота, на которую отвечает кандидат
+        self.last_question = messages[-1]["content"]
         self.pc = pc
         self.interview_service = interview_service
         self.interview_id = interview_id
-
-    async def connect_gladia(self):
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(
-                "https://api.gladia.io/v2/live",
-                headers={
-                    "Content-Type": "application/json",
-                    "X-Gladia-Key": config.GLADIA_API_KEY,
-                },
-                json={
-                    "encoding": "wav/pcm",
-                    "sample_rate": 16000,
-                    "bit_depth": 16,
-                    "channels": 1,
-                },
-                timeout=30.0,
-            )
-
-            if resp.status_code != 201:
-                raise RuntimeError(
-                    f"Gladia init failed: {resp.status_code} {resp.text}"
-                )
-            data = resp.json()
-            url = data["url"]
-
-        self.ws = await websockets.connect(url)
-        asyncio.create_task(self._receive_messages())
-
-    async def _receive_messages(self):
-        if not self.ws:
+        # Замеры задержек: текущая реплика и все завершённые
+        self.last_speech_at: float | None = None
+        self.last_final_at: float | None = None
+        self.timeline: TurnTimeline | None = None
+        self.timelines: list[TurnTimeline] = []
+
+    def _on_transcript(self, text: str, is_final: bool):
+        if is_final:
+            self.last_final_at = time.monotonic()
+            self.text_buffer.append(text)
+            self.partial_text = ""
+            self.turn.on_final_transcript()
+        else:
+            self.partial_text = text
+        if self.speculation and self._transcript() != self.speculation_text:
+            self._cancel_speculation()
+
+    def _transcript(self) -> str:
+        return " ".join(" ".join([*self.text_buffer, self.partial_text]).split())
+
+    def _speculate(self):
+        """Начать запрос к LLM, пока ещё идёт ожидание конца реплики."""
+        text = self._transcript()
+        if self.speculation or not text:
             return
-        async for message in self.ws:
-            msg = json.loads(message)
-            if msg.get("type") == "transcript" and msg.get("data", {}).get("is_final"):
-                text = msg["data"]["utterance"]["text"]
-                self.text_buffer.append(text)
+        self.speculation_text = text
+        self.speculation = InterviewReplyStream(self.context.prompt(), text, 5000)
+
+    def _cancel_speculation(self):
+        if self.speculation:
+            logger.debug("Speculative LLM request discarded")
+            self.speculation.cancel()
+            self.speculation = None
 
     async def _send_chunk(self, chunk: np.ndarray):
-        if not self.ws:
-            await self.connect_gladia()
-        if self.is_waiting_response.is_set():
-            chunk = np.zeros(320, dtype=np.int16)
-        int16_chunk = chunk.astype(np.int16)
-        await self.ws.send(  # type: ignore
-            json.dumps(
-                {
-                    "type": "audio_chunk",
-                    "data": {
-                        "chunk": base64.b64encode(int16_chunk.tobytes()).decode("utf-8")
-                    },
-                }
-            )
-        )
+        if self.turn.responding:
+            # Пока бот отвечает, звук кандидата в STT не отправляется
+            await self.stt.flush()
+            return
+        await self.stt.send(chunk)
 
     def _is_speech(self, chunk: np.ndarray) -> bool:
-        pcm_bytes = chunk.astype(np.int16).tobytes()
         try:
-            return self.vad.is_speech(pcm_bytes, 16000)
+            return self.vad.is_speech(chunk.tobytes(), 16000)
         except Exception as e:
             logger.error("VAD error: %s", e)
             return False
@@ -168,48 +216,150 @@ class AudioProcessor:
             return None
 
     async def send_to_tts(self):
-        if self.text_buffer:
-            self.is_waiting_response.set()
+        consumed = len(self.text_buffer)
+        answered = False
+        reply: InterviewReplyStream | None = None
+        result: InterviewReply | None = None
+        # Вопрос, на который отвечает кандидат, фиксируется до ответа бота
+        question = self.last_question
+        self._start_timeline()
+        try:
             full_text = " ".join(self.text_buffer)
             logger.info("Final utterance: %s", full_text)
 
-            messages, answer = await get_response(self.messages, full_text, 5000)
-            json_answer: dict = parse_llm_json(answer)
-
-            if not json_answer["continue_interview"]:
-                farewell_text = (
-                    await get_response(
-                        self.messages,
-                        "Сгенерируй текст для прощания с кандидатом, поблагодари его за \
-                              интервью и сообщи, что результат будет позже",
-                        5000,
-                    )
-                )[1]
-                task = None
-                if farewell_text:
-                    logger.info("Farewell received: %s", farewell_text)
-                    await self.tts_queue.put(synthesize_tts(farewell_text))
-                    task = asyncio.create_task(
-                        set_result(
-                            messages=messages,
-                            interview_service=self.interview_service,
-                            interview_id=self.interview_id,
-                        )
+            if self.speculation and self.speculation_text == " ".join(
+                full_text.split()
+            ):
+                logger.debug("Using speculative LLM response")
+                reply, self.speculation = self.speculation, None
+            else:
+                self._cancel_speculation()
+                reply = InterviewReplyStream(self.context.prompt(), full_text, 5000)
+
+            # Флаг continue_interview идёт в JSON перед ответом, поэтому
+            # к первому фрагменту ответа уже известно, завершается ли интервью.
+            # В последнем ответе модель сразу пишет прощание.
+            segments = reply.segments()
+            first = await anext(segments, "")
+            if reply.continue_interview is False:
+                self._start_closing(question, full_text)
+            if first:
+                answered = True
+                self.turn.speaking()
+                await enqueue_tts_stream(
+                    self.tts_track, prepend(first, segments), self.timeline
+                )
+            result = await reply.result()
+
+            if not result.continue_interview:
+                if not self.closing:
+                    self._start_closing(question, full_text)
+                if not answered:
+                    self.turn.speaking()
+                    await enqueue_tts(
+                        self.tts_track, result.answer or FAREWELL, self.timeline
                     )
-                    await self.tts_queue.join()
+                logger.info("Farewell: %s", result.answer)
+                await self.tts_track.wait_played()
+                self._finish_timeline(reply)
                 await self.pc.close()
                 pcs.discard(self.pc)
                 await self.close()
-                if task:
-                    await task
+                await self.result_task  # type: ignore
                 return
 
-            self.messages = messages
-            await self.tts_queue.put(synthesize_tts(json_answer["answer"]))
-            await self.tts_queue.join()
-            self.is_waiting_response.clear()
+            if not answered:
+                answered = True
+                self.turn.speaking()
+                await enqueue_tts(self.tts_track, result.answer, self.timeline)
+            await self.tts_track.wait_played()
+            # Между записью хода и очисткой буфера нет await, поэтому ход
+            # записывается ровно один раз: здесь или при перебивании
+            self._commit_turn(reply, question, full_text, result.answer)
             self.text_buffer.clear()
-        self.silence_frames = 0
+        except asyncio.CancelledError:
+            # Перебивание: если ответ уже озвучивался, реплика кандидата
+            # учтена в истории, иначе она склеится с продолжением речи
+            if answered:
+                del self.text_buffer[:consumed]
+                answer = result.answer if result else reply.answer.text
+                self._commit_turn(reply, question, full_text, answer)
+            raise
+        finally:
+            self._finish_timeline(reply)
+            if reply:
+                reply.cancel()
+            self._cancel_speculation()
+            self.partial_text = ""
+            self.turn.reset()
+            self.preroll.clear()
+
+    def _start_timeline(self):
+        timeline = self.timeline = TurnTimeline()
+        if self.last_speech_at is not None:
+            timeline.mark("speech_end", self.last_speech_at)
+        # Финальная расшифровка до конца речи относится к прошлой фразе
+        if self.last_final_at is not None and self.last_final_at >= (
+            self.last_speech_at or 0
+        ):
+            timeline.mark("final_transcript", self.last_final_at)
+        timeline.mark("turn_end")
+        self.tts_track.timeline = timeline
+
+    def _finish_timeline(self, reply: InterviewReplyStream | None):
+        timeline, self.timeline = self.timeline, None
+        if timeline is None:
+            return
+        self.tts_track.timeline = None
+        if reply:
+            timeline.mark("llm_start", reply.started_at)
+            if reply.first_token_at is not None:
+                timeline.mark("llm_first_token", reply.first_token_at)
+            if reply.finished_at is not None:
+                timeline.mark("llm_finish", reply.finished_at)
+        latency_metrics.record(timeline)
+        self.timelines.append(timeline)
+        logger.debug("Turn latency: %s", timeline.summary()["spans_ms"])
+
+    def _start_closing(self, question: str, text: str):
+        """Последняя реплика: оценка запускается параллельно с прощанием."""
+        self.closing = True
+        self.evaluator.add_turn(question, text)
+        self.result_task = asyncio.create_task(
+            set_result(
+                evaluator=self.evaluator,
+                interview_service=self.interview_service,
+                interview_id=self.interview_id,
+            )
+        )
+
+    def _commit_turn(
+        self, reply: InterviewReplyStream, question: str, text: str, answer: str
+    ):
+        """
+        Записать реплику кандидата и ответ бота в историю и отдать на оценку.
+
+        Вызывается ровно один раз за ход: после воспроизведения или при
+        перебивании.
+        """
+        self.context.add(reply.messages[-1], reply.reply_message())
+        self.evaluator.add_turn(question, text)
+        self.last_question = answer
+
+    async def barge_in(self):
+        logger.info("Candidate interrupted the answer, stopping playback")
+        preroll = list(self.preroll)
+        if self.response_task:
+            self.response_task.cancel()
+            # finally отменённого ответа сбрасывает состояние реплики и
+            # останавливает воспроизведение, поэтому он должен отработать
+            # до очистки буфера и повтора preroll
+            await asyncio.gather(self.response_task, return_exceptions=True)
+        self.tts_track.flush()
+        self.turn.reset()
+        self.preroll.clear()
+        for chunk in preroll:
+            await self._send_chunk(chunk)
 
     async def process(self, track: MediaStreamTrack):
         while True:
@@ -220,92 +370,137 @@ class AudioProcessor:
                     if resampled_frame:
                         audio_samples = resampled_frame.to_ndarray().flatten()
 
-                        if self._is_speech(audio_samples):
-                            self.silence_frames = 0
-                        else:
-                            self.silence_frames += 1
+                        is_speech = self._is_speech(audio_samples)
                         await self._send_chunk(audio_samples)
 
-                        if self.is_waiting_response.is_set():
+                        if self.turn.responding:
+                            self.turn.update(is_speech, has_text=False)
+                            self.preroll.append(audio_samples)
+                            if (
+                                config.BARGE_IN_ENABLED
+                                and not self.closing
+                                and self.turn.speech_frames >= self.min_barge_in_frames
+                            ):
+                                await self.barge_in()
                             continue
-                        if self.silence_frames > self.max_silence_frames:
-                            asyncio.create_task(self.send_to_tts())
+                        if is_speech:
+                            self.last_speech_at = time.monotonic()
+                        if self.turn.update(is_speech, has_text=bool(self.text_buffer)):
+                            self.response_task = asyncio.create_task(self.send_to_tts())
+                        elif self.turn.silence_frames == 0:
+                            # Кандидат продолжил говорить
+                            self._cancel_speculation()
+                        elif (
+                            config.LLM_SPECULATIVE
+                            and self.turn.silence_frames >= self.speculative_frames
+                        ):
+                            self._speculate()
 
             except Exception as e:
                 logger.error("Error processing audio frame: %s", e)
                 break
 
     async def close(self):
-        if self.ws:
+        # Кандидат мог отключиться во время ответа: recv() больше не
+        # вызывается, и без остановки трека play() и wait_played() не вернутся
+        self.tts_track.stop()
+        if self.response_task and not self.closing:
+            self.response_task.cancel()
+            await asyncio.gather(self.response_task, return_exceptions=True)
+        # Без итогового запроса оценки ответов никому не нужны
+        if self.result_task is None:
+            self.evaluator.cancel()
+        self.context.close()
+        await self.stt.close()
+        if self.timelines:
+            summary = interview_summary(self.interview_id, self.timelines)
+            self.timelines = []
             try:
-                await self.ws.close()
-                logger.info("Gladia connection closed")
+                await asyncio.to_thread(
+                    write_summary, config.LATENCY_SUMMARY_DIR, summary
+                )
             except Exception as e:
-                logger.error("Error closing Gladia WS: %s", e)
-            self.ws = None
+                logger.error("Failed to write latency summary", exc_info=e)
 
 
-def synthesize_tts(
-    text: str,
-    target_sample_rate: int = 16000,
-) -> np.ndarray:
-    print(text)
-    audio = tts_model.apply_tts(text=text, speaker="xenia", sample_rate=48000)
-    audio_numpy = audio.cpu().numpy().astype("float32")
-
-    num_samples = int(len(audio_numpy) * target_sample_rate / 48000)
-    audio_resampled = resample(audio_numpy, num_samples)
-
-    audio_int16 = (audio_resampled * 32767).clip(-32768, 32767).astype("int16")  # type: ignore
-
-    return audio_int16
+class TTSAudioTrack(MediaStreamTrack):
+    """
+    Исходящий аудиотрек бота.
 
+    Синтез пишет PCM через play() в кольцевой буфер, recv() каждые 20 мс
+    копирует очередной кадр в переиспользуемый AudioFrame. В простое
+    отдаётся тишина без ожиданий и новых аллокаций.
+    """
 
-class TTSAudioTrack(MediaStreamTrack):
     kind = "audio"
 
-    def __init__(self, tts_queue: asyncio.Queue):
+    def __init__(self, buffer_seconds: float = config.TTS_BUFFER_SECONDS):
         super().__init__()
-        self.tts_queue = tts_queue
-        self.buffer = np.zeros(0, dtype=np.int16)
+        self.sample_rate = TTS_SAMPLE_RATE
+        self.frame_size = TTS_SAMPLE_RATE // 50  # 20 мс
+        self.ring = AudioRingBuffer(int(self.sample_rate * buffer_seconds))
         self.last_pts = 0
-        self.sample_rate = 16000
-        self.frame_size = 320
         self.start_time = None
-        self.tts_started = False
+        # Выставляется на первом recv(), когда RTP-отправитель реально запущен
+        self.started = asyncio.Event()
+        self._space = asyncio.Event()
+        self._played = asyncio.Event()
+        self._played.set()
+        # Реплика, в которой ждут первый отправленный кадр со звуком
+        self.timeline: TurnTimeline | None = None
+
+        self._samples = np.zeros((1, self.frame_size), dtype=np.int16)
+        self._frame = AudioFrame(format="s16", layout="mono", samples=self.frame_size)
+        self._frame.sample_rate = self.sample_rate
+        self._frame.time_base = Fraction(1, self.sample_rate)
+
+    async def play(self, audio: np.ndarray):
+        """Добавить аудио в очередь воспроизведения, ожидая места в буфере."""
+        if self.readyState != "live":
+            return
+        self._played.clear()
+        offset = 0
+        while offset < len(audio) and self.readyState == "live":
+            offset += self.ring.write(audio[offset:])
+            if offset < len(audio):
+                self._space.clear()
+                await self._space.wait()
+
+    async def wait_played(self):
+        """Дождаться, пока всё записанное через play() будет отправлено."""
+        await self._played.wait()
+
+    def flush(self):
+        self.ring.clear()
+        self._space.set()
+        self._played.set()
+
+    def stop(self):
+        super().stop()
+        self.flush()
 
     async def recv(self):
-        if self.buffer.size == 0:
-            if self.tts_started:
-                self.tts_queue.task_done()
-                self.tts_started = False
-            try:
-                self.buffer = await asyncio.wait_for(
-                    self.tts_queue.get(), timeout=0.001
-                )
-                self.tts_started = True
-            except asyncio.TimeoutError:
-                self.buffer = np.zeros(self.frame_size, dtype=np.int16)
-            except Exception as e:
-                logger.error("Error in TTS: %s", e)
-                self.buffer = np.zeros(self.frame_size, dtype=np.int16)
-
-        frame_data = self.buffer[: self.frame_size]
-        self.buffer = self.buffer[self.frame_size :]
-
-        frame_data = frame_data[np.newaxis, :]
-        frame = AudioFrame.from_ndarray(frame_data, format="s16", layout="mono")
-        frame.sample_rate = self.sample_rate
+        self.started.set()
+        count = self.ring.read_into(self._samples[0])
+        if count < self.frame_size:
+            self._samples[0, count:] = 0
+        if count:
+            self._space.set()
+            if self.timeline:
+                self.timeline.mark("first_audio")
+                self.timeline = None
+        if self.ring.size == 0:
+            self._played.set()
+
+        frame = self._frame
+        frame.planes[0].update(self._samples)
         frame.pts = self.last_pts
-        frame.time_base = Fraction(1, self.sample_rate)
-        self.last_pts += frame.samples
+        self.last_pts += self.frame_size
 
         if self.start_time is None:
-            self.start_time = time.time()
+            self.start_time = time.monotonic()
 
-        expected_time = frame.pts / self.sample_rate
-        now = time.time() - self.start_time
-        wait = expected_time - now
+        wait = self.start_time + frame.pts / self.sample_rate - time.monotonic()
         if wait > 0:
             await asyncio.sleep(wait)
 
@@ -319,30 +514,58 @@ async def create_peer_connection(
     welcome_text: str,
     interview_service: InterviewService,
     interview_id: UUID,
+    welcome_audio: tuple[bytes, int] | None = None,
+    on_close: Callable[[], Awaitable[None]] | None = None,
 ) -> dict:
+    """
+    Создать сессию интервью и вернуть SDP-ответ.
+
+    on_close вызывается ровно один раз, когда ресурсы сессии уже
+    освобождены, в том числе если сессию не удалось создать.
+    """
     pc = RTCPeerConnection()
+    tts_track = TTSAudioTrack()
+    try:
+        processor = AudioProcessor(
+            tts_track,
+            [
+                *get_interview_instructions(questions),
+                {"role": "hr", "content": welcome_text},
+            ],
+            pc=pc,
+            interview_service=interview_service,
+            interview_id=interview_id,
+        )
+    except BaseException:
+        if on_close:
+            await on_close()
+        raise
     pcs.add(pc)
-    tts_queue = asyncio.Queue()
+    pc.addTrack(tts_track)
 
-    async def enqueue_text(text, delay):
-        await asyncio.sleep(delay)
-        await tts_queue.put(synthesize_tts(text))
+    async def play_welcome():
+        if welcome_audio and welcome_audio[1] == TTS_SAMPLE_RATE:
+            await tts_track.started.wait()
+            await tts_track.play(np.frombuffer(welcome_audio[0], dtype=np.int16))
+            return
 
-    asyncio.create_task(enqueue_text(welcome_text, 3))
+        # Аудио не подготовлено заранее: синтезируем, пока идёт установка связи
+        tasks = [
+            asyncio.create_task(tts_executor.synthesize(chunk))
+            for chunk in tts_chunks(welcome_text)
+        ]
+        try:
+            await tts_track.started.wait()
+            for task in tasks:
+                await tts_track.play(await task)
+        finally:
+            for task in tasks:
+                task.cancel()
 
-    tts_track = TTSAudioTrack(tts_queue)
-    pc.addTrack(tts_track)
+    welcome_task = asyncio.create_task(play_welcome())
 
-    processor = AudioProcessor(
-        tts_queue,
-        [
-            get_system_instruction(INTERVIEW.format(questions="\n".join(questions))),
-            {"role": "hr", "content": welcome_text},
-        ],
-        pc=pc,
-        interview_service=interview_service,
-        interview_id=interview_id,
-    )
+    # Сессия STT открывается параллельно с согласованием SDP
+    processor.stt.start()
 
     @pc.on("track")
     def on_track(track):
@@ -350,17 +573,58 @@ async def create_peer_connection(
             subscribed_track = relay.subscribe(track)
             asyncio.create_task(processor.process(subscribed_track))
 
+    closed = False
+
+    async def cleanup():
+        nonlocal closed
+        if closed:
+            return
+        closed = True
+        # Если закрытие начал watchdog, его задачу отменять нельзя
+        if watchdog_task is not asyncio.current_task():
+            watchdog_task.cancel()
+        welcome_task.cancel()
+        try:
+            await processor.close()
+        except Exception as e:
+            logger.error("Error closing interview session", exc_info=e)
+        try:
+            await pc.close()
+        finally:
+            # Место на узле и владение интервью освобождаются при любой ошибке
+            pcs.discard(pc)
+            if on_close:
+                await on_close()
+
+    async def watchdog():
+        await asyncio.sleep(config.RTC_CONNECT_TIMEOUT_S)
+        if pc.connectionState != "connected":
+            logger.warning("Connection was not established in time, closing")
+            await cleanup()
+            return
+        # Зависшая сессия не должна навсегда занимать место на узле
+        await asyncio.sleep(config.RTC_MAX_SESSION_S - config.RTC_CONNECT_TIMEOUT_S)
+        logger.warning("Interview exceeded the maximum duration, closing")
+        await cleanup()
+
+    watchdog_task = asyncio.create_task(watchdog())
+
     @pc.on("connectionstatechange")
     async def on_connectionstatechange():
         logger.info("Connection state is %s", pc.connectionState)
         if pc.connectionState in ("failed", "closed"):
-            await processor.close()
-            await pc.close()
-            pcs.discard(pc)
+            await cleanup()
 
-    await pc.setRemoteDescription(RTCSessionDescription(sdp=offer_sdp, type=offer_type))
-    answer = await pc.createAnswer()
-    await pc.setLocalDescription(answer)
+    try:
+        await pc.setRemoteDescription(
+            RTCSessionDescription(sdp=offer_sdp, type=offer_type)
+        )
+        answer = await pc.createAnswer()
+        await pc.setLocalDescription(answer)
+    except BaseException:
+        # Например, некорректный SDP: STT, приветствие и watchdog уже запущены
+        await asyncio.shield(cleanup())
+        raise
 
     return {"sdp": pc.localDescription.sdp, "type": pc.localDescription.type}
 
@@ -372,4 +636,7 @@ async def shutdown():
     coros = [pc.close() for pc in pcs]
     await asyncio.gather(*coros)
     pcs.clear()
+    # join() потоков TTS не должен блокировать event loop
+    await asyncio.to_thread(tts_executor.stop)
+    await shutdown_stt()
     logger.info("Server shutdown, all peer connections closed.")
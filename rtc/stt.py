@@ -0,0 +1,350 @@
+import asyncio
+import base64
+import importlib.util
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import deque
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+import webrtcvad
+import websockets
+
+from config import STTBackends, config
+from http_client import http_client
+
+logger = logging.getLogger("stt")
+
+GLADIA_URL = "https://api.gladia.io/v2/live"
+STT_SAMPLE_RATE = 16000
+
+TranscriptCallback = Callable[[str, bool], None]
+
+
+async def init_gladia_session() -> str:
+    """Создать live-сессию Gladia и вернуть URL её websocket."""
+    resp = await http_client.post(
+        "gladia",
+        GLADIA_URL,
+        headers={
+            "Content-Type": "application/json",
+            "X-Gladia-Key": config.GLADIA_API_KEY,
+        },
+        json={
+            "encoding": "wav/pcm",
+            "sample_rate": STT_SAMPLE_RATE,
+            "bit_depth": 16,
+            "channels": 1,
+            # Промежуточные расшифровки нужны для спекулятивных запросов к LLM
+            "messages_config": {
+                "receive_partial_transcripts": config.LLM_SPECULATIVE,
+            },
+        },
+    )
+    if resp.status_code != 201:
+        raise RuntimeError(f"Gladia init failed: {resp.status_code} {resp.text}")
+    return resp.json()["url"]
+
+
+class GladiaSessionPool:
+    """
+    Запас заранее инициализированных сессий Gladia.
+
+    Init-запрос выполняется до прихода кандидата, поэтому при подключении
+    остаётся только websocket-рукопожатие. Сессии старше max_age
+    заменяются свежими фоновой задачей.
+    """
+
+    def __init__(self, size: int, max_age: float):
+        self.size = size
+        self.max_age = max_age
+        self._sessions: deque[tuple[float, str]] = deque()
+        self._wakeup = asyncio.Event()
+        self._task: asyncio.Task | None = None
+
+    async def acquire(self) -> str:
+        while self._sessions:
+            created_at, url = self._sessions.popleft()
+            if time.monotonic() - created_at < self.max_age:
+                self._wakeup.set()
+                return url
+        self._wakeup.set()
+        return await init_gladia_session()
+
+    def start(self):
+        if self.size and self._task is None:
+            self._task = asyncio.create_task(self._maintain())
+
+    def stop(self):
+        if self._task:
+            self._task.cancel()
+            self._task = None
+        self._sessions.clear()
+
+    async def _maintain(self):
+        while True:
+            while self._sessions and (
+                time.monotonic() - self._sessions[0][0] >= self.max_age
+            ):
+                self._sessions.popleft()
+            retry_delay = 1.0
+            try:
+                while len(self._sessions) < self.size:
+                    url = await init_gladia_session()
+                    self._sessions.append((time.monotonic(), url))
+            except Exception as e:
+                logger.error("Failed to pre-initialize Gladia session", exc_info=e)
+                retry_delay = 5.0
+
+            oldest = self._sessions[0][0] if self._sessions else time.monotonic()
+            self._wakeup.clear()
+            try:
+                await asyncio.wait_for(
+                    self._wakeup.wait(),
+                    timeout=max(oldest + self.max_age - time.monotonic(), retry_delay),
+                )
+            except asyncio.TimeoutError:
+                pass
+
+
+gladia_pool = GladiaSessionPool(
+    size=config.STT_POOL_SIZE, max_age=config.STT_POOL_MAX_AGE_S
+)
+
+
+class STTBackend(ABC):
+    """
+    Потоковое распознавание речи одной сессии интервью.
+
+    Медиа-цикл передаёт в send() кадры 16 кГц int16 и никогда не ждёт
+    подключения: кадры копятся до STT_CHUNK_MS, а до установки соединения
+    складываются в ограниченный backlog. Расшифровки возвращаются через
+    on_transcript(text, is_final).
+    """
+
+    name: str
+
+    def __init__(self, on_transcript: TranscriptCallback):
+        self.on_transcript = on_transcript
+        self.connected = False
+        self.connect_task: asyncio.Task | None = None
+        self.uplink = np.zeros(
+            config.STT_CHUNK_MS * STT_SAMPLE_RATE // 1000, dtype=np.int16
+        )
+        self.uplink_size = 0
+        self.backlog: deque[bytes] = deque(
+            maxlen=config.STT_BACKLOG_MS // config.STT_CHUNK_MS
+        )
+
+    @classmethod
+    def check_available(cls):
+        """Проверить зависимости бэкенда до открытия сессии."""
+
+    def start(self):
+        """Начать подключение в фоне."""
+        if self.connect_task is None:
+            self.connect_task = asyncio.create_task(self._start())
+
+    async def _start(self):
+        try:
+            await self._connect()
+            # Звук, накопленный во время подключения, уходит первым
+            while self.backlog:
+                await self._send_audio(self.backlog.popleft())
+        except Exception as e:
+            logger.error("%s connection failed", self.name, exc_info=e)
+            # Следующая попытка не раньше чем через секунду
+            await asyncio.sleep(1)
+            self.connect_task = None
+            return
+        self.connected = True
+
+    async def send(self, chunk: np.ndarray):
+        if not self.connected:
+            self.start()
+        offset = 0
+        while offset < len(chunk):
+            count = min(len(chunk) - offset, len(self.uplink) - self.uplink_size)
+            self.uplink[self.uplink_size : self.uplink_size + count] = chunk[
+                offset : offset + count
+            ]
+            self.uplink_size += count
+            offset += count
+            if self.uplink_size == len(self.uplink):
+                await self.flush()
+
+    async def flush(self):
+        if not self.uplink_size:
+            return
+        payload = self.uplink[: self.uplink_size].tobytes()
+        self.uplink_size = 0
+        if self.connected:
+            await self._send_audio(payload)
+        else:
+            self.backlog.append(payload)
+
+    async def close(self):
+        if self.connect_task:
+            self.connect_task.cancel()
+        self.connected = False
+        try:
+            await self._close()
+            logger.info("%s connection closed", self.name)
+        except Exception as e:
+            logger.error("Error closing %s: %s", self.name, e)
+
+    @abstractmethod
+    async def _connect(self): ...
+
+    @abstractmethod
+    async def _send_audio(self, payload: bytes): ...
+
+    @abstractmethod
+    async def _close(self): ...
+
+
+class GladiaSTT(STTBackend):
+    name = "Gladia"
+
+    def __init__(self, on_transcript: TranscriptCallback):
+        super().__init__(on_transcript)
+        self.ws: websockets.ClientConnection | None = None
+        self.receive_task: asyncio.Task | None = None
+
+    async def _connect(self):
+        url = await gladia_pool.acquire()
+        self.ws = await websockets.connect(url)
+        self.receive_task = asyncio.create_task(self._receive_messages())
+
+    async def _receive_messages(self):
+        async for message in self.ws:  # type: ignore
+            msg = json.loads(message)
+            if msg.get("type") == "transcript":
+                data = msg.get("data", {})
+                self.on_transcript(data["utterance"]["text"], data.get("is_final"))
+
+    async def _send_audio(self, payload: bytes):
+        if config.STT_BINARY_FRAMES:
+            await self.ws.send(payload)  # type: ignore
+            return
+        await self.ws.send(  # type: ignore
+            json.dumps(
+                {
+                    "type": "audio_chunk",
+                    "data": {"chunk": base64.b64encode(payload).decode("utf-8")},
+                }
+            )
+        )
+
+    async def _close(self):
+        if self.receive_task:
+            self.receive_task.cancel()
+        if self.ws:
+            await self.ws.close()
+            self.ws = None
+
+
+class VoskSTT(STTBackend):
+    """
+    Локальное распознавание на CPU через Vosk, без сетевых задержек.
+
+    Требует пакет vosk и модель по пути STT_VOSK_MODEL_PATH.
+    """
+
+    name = "Vosk"
+    _model = None
+
+    @classmethod
+    def check_available(cls):
+        if importlib.util.find_spec("vosk") is None:
+            raise RuntimeError(
+                "STT_BACKEND=vosk requires the vosk package: pip install vosk"
+            )
+
+    async def _connect(self):
+        from vosk import KaldiRecognizer, Model
+
+        if VoskSTT._model is None:
+            VoskSTT._model = await asyncio.to_thread(Model, config.STT_VOSK_MODEL_PATH)
+        self.recognizer = KaldiRecognizer(VoskSTT._model, STT_SAMPLE_RATE)
+
+    def _accept(self, payload: bytes) -> tuple[str, bool]:
+        if self.recognizer.AcceptWaveform(payload):
+            return json.loads(self.recognizer.Result()).get("text", ""), True
+        return json.loads(self.recognizer.PartialResult()).get("partial", ""), False
+
+    async def _send_audio(self, payload: bytes):
+        text, is_final = await asyncio.to_thread(self._accept, payload)
+        if text:
+            self.on_transcript(text, is_final)
+
+    async def _close(self):
+        pass
+
+
+class ScriptedSTT(STTBackend):
+    """
+    Подставной STT для нагрузочных тестов медиа-конвейера.
+
+    Фразы по одной на строку читаются из STT_SCRIPT_PATH. Каждый участок
+    речи, найденный VAD и завершённый паузой, «распознаётся» как очередная
+    фраза сценария, с задержкой STT_SCRIPT_LATENCY_MS.
+    """
+
+    name = "Scripted STT"
+
+    def __init__(self, on_transcript: TranscriptCallback):
+        super().__init__(on_transcript)
+        self.vad = webrtcvad.Vad(2)
+        self.speech_frames = 0
+        self.silence_frames = 0
+        self.lines: deque[str] = deque()
+
+    async def _connect(self):
+        path = config.STT_SCRIPT_PATH
+        text = await asyncio.to_thread(Path(path).read_text) if path else ""
+        self.lines = deque(line for line in text.splitlines() if line.strip())
+
+    async def _send_audio(self, payload: bytes):
+        frame_bytes = STT_SAMPLE_RATE // 50 * 2
+        for i in range(0, len(payload) - frame_bytes + 1, frame_bytes):
+            if self.vad.is_speech(payload[i : i + frame_bytes], STT_SAMPLE_RATE):
+                self.speech_frames += 1
+                self.silence_frames = 0
+                continue
+            self.silence_frames += 1
+            if self.speech_frames >= 5 and self.silence_frames >= 15:
+                self.speech_frames = 0
+                asyncio.create_task(self._emit())
+
+    async def _emit(self):
+        await asyncio.sleep(config.STT_SCRIPT_LATENCY_MS / 1000)
+        text = self.lines.popleft() if self.lines else "Да."
+        self.on_transcript(text, True)
+
+    async def _close(self):
+        pass
+
+
+STT_BACKENDS: dict[STTBackends, type[STTBackend]] = {
+    STTBackends.GLADIA: GladiaSTT,
+    STTBackends.VOSK: VoskSTT,
+    STTBackends.SCRIPTED: ScriptedSTT,
+}
+
+
+def check_stt_backend():
+    # Без пакета подключение падало бы в фоне раз в секунду
+    STT_BACKENDS[config.STT_BACKEND].check_available()
+
+
+def create_stt_backend(on_transcript: TranscriptCallback) -> STTBackend:
+    check_stt_backend()
+    return STT_BACKENDS[config.STT_BACKEND](on_transcript)
+
+
+async def shutdown_stt():
+    gladia_pool.stop()
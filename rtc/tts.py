@@ -0,0 +1,363 @@
+import asyncio
+import logging
+import queue
+import re
+import threading
+import time
+from dataclasses import dataclass
+from math import gcd
+
+import numpy as np
+import torch
+from scipy.signal import resample_poly
+
+from config import config
+from rtc.tts_cache import TTSCache, cache_key
+
+logger = logging.getLogger("tts")
+
+# Opus в WebRTC работает на 48 кГц, поэтому синтез на этой частоте
+# не требует передискретизации ни у нас, ни в кодировщике aiortc
+TTS_SAMPLE_RATE = config.TTS_SAMPLE_RATE
+SILERO_SAMPLE_RATES = (8000, 24000, 48000)
+
+
+def resolve_device(name: str) -> torch.device:
+    if name == "auto":
+        return torch.device("cuda" if torch.cuda.is_available() else "cpu")
+    return torch.device(name)
+
+
+def _quantize(model):
+    # Динамическая int8-квантизация линейных слоёв, ускоряет инференс на CPU
+    try:
+        model.model = torch.ao.quantization.quantize_dynamic(
+            model.model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    except Exception as e:
+        logger.warning(
+            "TTS model does not support quantization, using fp32", exc_info=e
+        )
+    return model
+
+
+def load_tts_model(
+    device_name: str = config.TTS_DEVICE,
+    quantize: bool = config.TTS_QUANTIZE,
+    num_threads: int = config.TTS_NUM_THREADS,
+):
+    device = resolve_device(device_name)
+    if device.type == "cpu":
+        # Ограничиваем intra-op потоки, чтобы не конкурировать с OCR
+        torch.set_num_threads(num_threads)
+
+    model, _ = torch.hub.load(
+        repo_or_dir="snakers4/silero-models",
+        model="silero_tts",
+        language="ru",
+        speaker="v4_ru",
+    )  # type: ignore
+    model.to(device)
+
+    if quantize:
+        if device.type == "cpu":
+            model = _quantize(model)
+        else:
+            logger.warning("TTS quantization is only available on CPU, ignoring")
+
+    logger.info(
+        "TTS model loaded on %s (quantized: %s, threads: %d)",
+        device,
+        quantize and device.type == "cpu",
+        torch.get_num_threads(),
+    )
+    return model
+
+
+_SENTENCE_END = re.compile(r"(?<=[.!?…;])\s+")
+_CLAUSE_END = re.compile(r"(?<=[,:—])\s+")
+
+
+def split_sentences(
+    text: str,
+    min_chars: int = config.TTS_STREAM_MIN_CHARS,
+    max_chars: int = config.TTS_STREAM_MAX_CHARS,
+) -> list[str]:
+    """
+    Разбить ответ на фразы для потокового синтеза.
+
+    Первая фраза отдаётся как есть, чтобы звук начался как можно раньше,
+    последующие короткие фразы склеиваются до min_chars, а слишком длинные
+    предложения режутся по запятым.
+    """
+    parts: list[str] = []
+    for sentence in _SENTENCE_END.split(text.strip()):
+        sentence = sentence.strip()
+        if not sentence:
+            continue
+        if len(sentence) <= max_chars:
+            parts.append(sentence)
+            continue
+        clause = ""
+        for piece in _CLAUSE_END.split(sentence):
+            if clause and len(clause) + len(piece) + 1 > max_chars:
+                parts.append(clause)
+                clause = piece
+            else:
+                clause = f"{clause} {piece}".strip()
+        if clause:
+            parts.append(clause)
+
+    chunks: list[str] = []
+    for part in parts:
+        if len(chunks) > 1 and len(chunks[-1]) < min_chars:
+            chunks[-1] = f"{chunks[-1]} {part}"
+        else:
+            chunks.append(part)
+    return chunks
+
+
+def tts_chunks(text: str) -> list[str]:
+    return split_sentences(text) if config.TTS_STREAMING else [text]
+
+
+class SentenceStream:
+    """
+    Нарезка на фразы текста, который приходит по частям от LLM.
+
+    Фраза отдаётся, когда за ней пришёл разделитель предложений: первая
+    сразу, следующие по накоплении min_chars. Без TTS_STREAMING весь текст
+    отдаётся одним куском в close().
+    """
+
+    def __init__(
+        self,
+        min_chars: int = config.TTS_STREAM_MIN_CHARS,
+        max_chars: int = config.TTS_STREAM_MAX_CHARS,
+    ):
+        self.min_chars = min_chars
+        self.max_chars = max_chars
+        self.pending = ""
+        self.first = True
+
+    def feed(self, text: str) -> list[str]:
+        self.pending += text
+        if not config.TTS_STREAMING:
+            return []
+        end = None
+        for end in _SENTENCE_END.finditer(self.pending):
+            pass
+        if end is None and len(self.pending) > self.max_chars:
+            # Длинное предложение без точки режется по последней запятой
+            for end in _CLAUSE_END.finditer(self.pending):
+                pass
+        if end is None:
+            return []
+        complete = self.pending[: end.start()]
+        if not self.first and len(complete) < self.min_chars:
+            return []
+        self.pending = self.pending[end.end() :]
+        self.first = False
+        return split_sentences(complete, self.min_chars, self.max_chars)
+
+    def close(self) -> list[str]:
+        text, self.pending = self.pending, ""
+        return tts_chunks(text) if text.strip() else []
+
+
+def synthesize_tts(
+    model,
+    text: str,
+    target_sample_rate: int = TTS_SAMPLE_RATE,
+    speaker: str = config.TTS_SPEAKER,
+) -> np.ndarray:
+    logger.debug("Synthesizing: %s", text)
+    if target_sample_rate in SILERO_SAMPLE_RATES:
+        render_rate = target_sample_rate
+    else:
+        render_rate = 48000
+    audio = model.apply_tts(text=text, speaker=speaker, sample_rate=render_rate)
+    audio_numpy = audio.cpu().numpy().astype("float32")
+
+    if render_rate != target_sample_rate:
+        # Полифазный фильтр вместо FFT по всей фразе
+        divisor = gcd(target_sample_rate, render_rate)
+        audio_numpy = resample_poly(
+            audio_numpy, target_sample_rate // divisor, render_rate // divisor
+        )
+
+    audio_int16 = (audio_numpy * 32767).clip(-32768, 32767).astype("int16")  # type: ignore
+
+    return audio_int16
+
+
+@dataclass
+class _TTSJob:
+    text: str
+    key: str
+    future: asyncio.Future
+    loop: asyncio.AbstractEventLoop
+
+
+def _resolve(future: asyncio.Future, result=None, error: BaseException | None = None):
+    if future.done():
+        return
+    if error is not None:
+        future.set_exception(error)
+    else:
+        future.set_result(result)
+
+
+class TTSExecutor:
+    """
+    Пул потоков, владеющий моделью TTS.
+
+    Модель загружается в фоне при первом start() и прогревается пробным
+    синтезом; до этого задачи копятся в очереди, а ready остаётся False.
+    Корутины отправляют текст через synthesize() и не блокируют event loop.
+    Число ожидающих задач ограничено max_pending. Каждый воркер берёт по
+    одной задаче: Silero синтезирует один текст за вызов, поэтому общий
+    батч для разных сессий невозможен, а параллельность дают только
+    несколько воркеров.
+    Уже синтезированные фразы берутся из cache без обращения к модели.
+    """
+
+    def __init__(
+        self,
+        cache: TTSCache,
+        workers: int = config.TTS_WORKERS,
+        max_pending: int = config.TTS_MAX_PENDING,
+    ):
+        self.cache = cache
+        self.workers = workers
+        self._jobs: queue.Queue[_TTSJob | None] = queue.Queue()
+        self._slots = asyncio.Semaphore(max_pending)
+        self.model = None
+        self.error: Exception | None = None
+        self._ready = threading.Event()
+        self._loader: threading.Thread | None = None
+        self._threads: list[threading.Thread] = []
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    @property
+    def ready(self) -> bool:
+        return self._ready.is_set()
+
+    def start(self):
+        with self._lock:
+            if self._loader:
+                return
+            self._loader = threading.Thread(
+                target=self._load, name="tts-loader", daemon=True
+            )
+        self._loader.start()
+
+    def stop(self, timeout: float = 5.0):
+        if self._loader:
+            self._loader.join(timeout)
+        for _ in self._threads:
+            self._jobs.put(None)
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads.clear()
+        self._loader = None
+        self._ready.clear()
+
+    def _load(self):
+        started = time.monotonic()
+        try:
+            self.model = load_tts_model()
+            with torch.inference_mode():
+                synthesize_tts(self.model, "Здравствуйте.")
+        except Exception as e:
+            logger.critical("TTS model loading failed", exc_info=e)
+            self._fail_pending(e)
+            return
+
+        for i in range(self.workers):
+            thread = threading.Thread(target=self._run, name=f"tts-{i}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        self._ready.set()
+        logger.info(
+            "TTS executor ready with %d worker(s) in %.1fs",
+            self.workers,
+            time.monotonic() - started,
+        )
+
+    def _fail_pending(self, error: Exception):
+        """Завершить ошибкой задачи, которые уже некому обработать."""
+        with self._lock:
+            self.error = error
+            while True:
+                try:
+                    job = self._jobs.get_nowait()
+                except queue.Empty:
+                    break
+                if job is None:
+                    continue
+                self._pending -= 1
+                job.loop.call_soon_threadsafe(_resolve, job.future, None, error)
+
+    async def synthesize(self, text: str) -> np.ndarray:
+        key = cache_key(text, config.TTS_SPEAKER, TTS_SAMPLE_RATE)
+        audio = self.cache.get(key)
+        if audio is not None:
+            return audio
+
+        self.start()
+        async with self._slots:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            with self._lock:
+                # Без модели задачу некому обработать
+                if self.error is not None:
+                    raise self.error
+                self._pending += 1
+                self._jobs.put(_TTSJob(text=text, key=key, future=future, loop=loop))
+            return await future
+
+    def _run(self):
+        while (job := self._jobs.get()) is not None:
+            with torch.inference_mode():
+                self._process(job)
+
+    def _process(self, job: _TTSJob):
+        audio, error = None, None
+        # Сессия могла отменить запрос, пока он ждал в очереди
+        if not job.future.cancelled():
+            try:
+                audio = self.cache.load(job.key)
+                if audio is None:
+                    audio = self.cache.put(
+                        job.key, synthesize_tts(self.model, job.text)
+                    )
+            except Exception as e:
+                logger.error("TTS synthesis failed", exc_info=e)
+                error = e
+        with self._lock:
+            self._pending -= 1
+        job.loop.call_soon_threadsafe(_resolve, job.future, audio, error)
+
+
+tts_cache = TTSCache(
+    max_bytes=config.TTS_CACHE_MAX_MB * 1024 * 1024,
+    directory=config.TTS_CACHE_DIR,
+)
+tts_executor = TTSExecutor(tts_cache)
+
+
+async def render_text(text: str) -> np.ndarray:
+    """
+    Синтезировать текст целиком, по тем же фразам, что и при потоковом
+    воспроизведении, чтобы результат попадал в общий кэш.
+    """
+    chunks = [await tts_executor.synthesize(chunk) for chunk in tts_chunks(text)]
+    if not chunks:
+        return np.zeros(0, dtype=np.int16)
+    return np.concatenate(chunks)
@@ -0,0 +1,108 @@
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+
+import numpy as np
+
+logger = logging.getLogger("tts")
+
+
+def cache_key(text: str, speaker: str, sample_rate: int) -> str:
+    normalized = " ".join(text.split())
+    return hashlib.sha256(
+        f"{speaker}|{sample_rate}|{normalized}".encode("utf-8")
+    ).hexdigest()
+
+
+class TTSCache:
+    """
+    Кэш синтезированных фраз: LRU в памяти с ограничением по размеру
+    и необязательное хранилище int16 PCM на диске.
+
+    Возвращаемые массивы доступны только для чтения, так как одна и та же
+    фраза может одновременно играть в нескольких сессиях.
+    """
+
+    def __init__(self, max_bytes: int, directory: str | None = None):
+        self.max_bytes = max_bytes
+        self.directory = Path(directory) if directory else None
+        if self.directory:
+            self.directory.mkdir(parents=True, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+        self._items: OrderedDict[str, np.ndarray] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.pcm"  # type: ignore
+
+    def get(self, key: str) -> np.ndarray | None:
+        """Поиск в памяти, безопасен для вызова из event loop."""
+        with self._lock:
+            audio = self._items.get(key)
+            if audio is not None:
+                self._items.move_to_end(key)
+                self.hits += 1
+            return audio
+
+    def load(self, key: str) -> np.ndarray | None:
+        """Поиск на диске, вызывается из потока TTS."""
+        audio = None
+        if self.directory:
+            try:
+                audio = np.fromfile(self._path(key), dtype=np.int16)
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                logger.error("TTS cache read error", exc_info=e)
+
+        with self._lock:
+            if audio is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        self._remember(key, audio)
+        return audio
+
+    def put(self, key: str, audio: np.ndarray) -> np.ndarray:
+        audio = np.ascontiguousarray(audio, dtype=np.int16)
+        self._remember(key, audio)
+        if self.directory:
+            path = self._path(key)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            try:
+                path.parent.mkdir(exist_ok=True)
+                audio.tofile(tmp_path)
+                os.replace(tmp_path, path)
+            except OSError as e:
+                logger.error("TTS cache write error", exc_info=e)
+        return audio
+
+    def _remember(self, key: str, audio: np.ndarray):
+        if audio.nbytes > self.max_bytes:
+            return
+        audio.setflags(write=False)
+        with self._lock:
+            previous = self._items.pop(key, None)
+            if previous is not None:
+                self._size -= previous.nbytes
+            self._items[key] = audio
+            self._size += audio.nbytes
+            while self._size > self.max_bytes:
+                _, evicted = self._items.popitem(last=False)
+                self._size -= evicted.nbytes
+
+    def stats(self) -> dict:
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / total if total else 0.0,
+                "entries": len(self._items),
+                "bytes": self._size,
+            }
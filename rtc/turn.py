@@ -0,0 +1,80 @@
+import enum
+
+FRAME_MS = 20
+
+
+class TurnState(enum.Enum):
+    LISTENING = "listening"
+    END_PENDING = "end_pending"
+    THINKING = "thinking"
+    SPEAKING = "speaking"
+
+
+class TurnDetector:
+    """
+    Очерёдность реплик в интервью.
+
+    LISTENING -> END_PENDING: кандидат замолчал, а расшифровка не пуста.
+    END_PENDING -> THINKING: пауза превысила порог, реплика отправляется в LLM.
+    THINKING -> SPEAKING -> LISTENING: бот отвечает, затем снова слушает.
+
+    Порог паузы адаптивный: если STT уже прислал финальную расшифровку
+    после последней речи, достаточно min_silence_ms, иначе ждём
+    max_silence_ms. Решения VAD сглаживаются, чтобы одиночные шумовые
+    кадры не сбрасывали отсчёт тишины.
+    """
+
+    def __init__(self, min_silence_ms: int, max_silence_ms: int):
+        self.min_silence_frames = min_silence_ms // FRAME_MS
+        self.max_silence_frames = max_silence_ms // FRAME_MS
+        self.state = TurnState.LISTENING
+        self.speech_level = 0.0
+        self.silence_frames = 0
+        self.speech_frames = 0
+        self.final_after_speech = False
+
+    @property
+    def responding(self) -> bool:
+        return self.state in (TurnState.THINKING, TurnState.SPEAKING)
+
+    @property
+    def silence_threshold(self) -> int:
+        if self.final_after_speech:
+            return self.min_silence_frames
+        return self.max_silence_frames
+
+    def on_final_transcript(self):
+        self.final_after_speech = True
+
+    def update(self, is_speech: bool, has_text: bool) -> bool:
+        """Учесть очередной кадр VAD, вернуть True, если реплика завершена."""
+        self.speech_frames = self.speech_frames + 1 if is_speech else 0
+        self.speech_level = 0.7 * self.speech_level + 0.3 * is_speech
+
+        if self.responding:
+            return False
+
+        if self.speech_level >= 0.5:
+            self.silence_frames = 0
+            self.final_after_speech = False
+            self.state = TurnState.LISTENING
+            return False
+
+        self.silence_frames += 1
+        if not has_text:
+            return False
+
+        self.state = TurnState.END_PENDING
+        if self.silence_frames >= self.silence_threshold:
+            self.state = TurnState.THINKING
+            return True
+        return False
+
+    def speaking(self):
+        self.state = TurnState.SPEAKING
+
+    def reset(self):
+        self.state = TurnState.LISTENING
+        self.silence_frames = 0
+        self.speech_frames = 0
+        self.final_after_speech = False
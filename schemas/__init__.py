@@ -30,3 +30,9 @@ from .interview import (
     InterviewCandidateResponse,
     InterviewResultEnum,
 )
+from .llm_output import (
+    AnswerScore,
+    InterviewQuestionList,
+    InterviewReply,
+    InterviewVerdict,
+)
@@ -0,0 +1,36 @@
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict, Field
+
+# Схема для провайдера запрещает лишние поля, а при разборе они игнорируются
+_STRICT = ConfigDict(json_schema_extra={"additionalProperties": False})
+
+
+class InterviewReply(BaseModel):
+    model_config = _STRICT
+
+    continue_interview: bool
+    answer: str
+
+
+class InterviewVerdict(BaseModel):
+    model_config = _STRICT
+
+    hr_feedback: str
+    candidate_feedback: str
+    status: Literal["PASSED", "REJECTED"]
+
+
+class AnswerScore(BaseModel):
+    model_config = _STRICT
+
+    topic: str
+    score: int = Field(ge=0, le=10)
+    evidence: list[str]
+    comment: str
+
+
+class InterviewQuestionList(BaseModel):
+    model_config = _STRICT
+
+    questions: list[str]
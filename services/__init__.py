@@ -6,4 +6,5 @@ from .resume_service import ResumeService
 from .token_service import RefreshTokenService
 from .user_service import UserService
 from .vacancy_service import VacancyService
-from .questions_service import InterviewQuestionsService
\ No newline at end of file
+from .questions_service import InterviewQuestionsService
+from .llm_cache_service import LLMCacheService
\ No newline at end of file
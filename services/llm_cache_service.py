@@ -0,0 +1,57 @@
+from datetime import datetime, timedelta, timezone
+from uuid import UUID
+
+from sqlalchemy import delete
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from models import LLMCacheOrm
+
+
+class LLMCacheService:
+    """Сохранённые ответы LLM для детерминированных запросов (скрининг, вопросы)."""
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self.session_factory = session_factory
+
+    async def get(self, key: str) -> str | None:
+        async with self.session_factory() as session:
+            entry = await session.get(LLMCacheOrm, key)
+            if entry is None:
+                return None
+            expires_at = entry.expires_at
+            # SQLite возвращает время без часового пояса
+            if expires_at.tzinfo is None:
+                expires_at = expires_at.replace(tzinfo=timezone.utc)
+            if expires_at <= datetime.now(timezone.utc):
+                await session.delete(entry)
+                await session.commit()
+                return None
+            return entry.value
+
+    async def set(
+        self,
+        key: str,
+        purpose: str,
+        value: str,
+        ttl: timedelta,
+        vacancy_id: UUID | None = None,
+    ) -> None:
+        async with self.session_factory() as session:
+            await session.merge(
+                LLMCacheOrm(
+                    key=key,
+                    purpose=purpose,
+                    vacancy_id=vacancy_id,
+                    value=value,
+                    created_at=datetime.now(timezone.utc),
+                    expires_at=datetime.now(timezone.utc) + ttl,
+                )
+            )
+            await session.commit()
+
+    async def invalidate_vacancy(self, vacancy_id: UUID) -> None:
+        async with self.session_factory() as session:
+            await session.execute(
+                delete(LLMCacheOrm).where(LLMCacheOrm.vacancy_id == vacancy_id)
+            )
+            await session.commit()
@@ -1,7 +1,7 @@
 import json
 from uuid import UUID
 
-from sqlalchemy import delete, select
+from sqlalchemy import delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from models import InterviewQuestions
@@ -59,6 +59,30 @@ class InterviewQuestionsService:
                 return row
             return ""
 
+    async def set_welcome_audio(
+        self, interview_id: UUID, audio: bytes, sample_rate: int
+    ) -> None:
+        async with self.session_factory() as session:
+            await session.execute(
+                update(InterviewQuestions)
+                .where(InterviewQuestions.interview_id == interview_id)
+                .values(welcome_audio=audio, welcome_sample_rate=sample_rate)
+            )
+            await session.commit()
+
+    async def get_welcome_audio(self, interview_id: UUID) -> tuple[bytes, int] | None:
+        async with self.session_factory() as session:
+            result = await session.execute(
+                select(
+                    InterviewQuestions.welcome_audio,
+                    InterviewQuestions.welcome_sample_rate,
+                ).where(InterviewQuestions.interview_id == interview_id)
+            )
+            row = result.one_or_none()
+            if row and row.welcome_audio:
+                return row.welcome_audio, row.welcome_sample_rate
+            return None
+
     async def delete(self, interview_id: UUID) -> None:
         async with self.session_factory() as session:
             await session.execute(
@@ -4,6 +4,7 @@ import json
 import logging
 import re
 import tempfile
+from datetime import timedelta
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from pathlib import Path
@@ -20,12 +21,30 @@ from striprtf.striprtf import rtf_to_text
 
 from config import config
 from exceptions import NotFoundError
-from llm import get_response, get_system_instruction
-from resources.prompts import AUTO_SCREENING, INTERVIEW, QUESTIONS
+from http_client import http_client
+from llm import (
+    build_payload,
+    get_interview_instructions,
+    get_response,
+    get_structured,
+    get_system_instruction,
+    llm_usage,
+    payload_key,
+    request_key,
+    response_format,
+)
+from resources.prompts import AUTO_SCREENING, QUESTIONS
+from rtc.tts import TTS_SAMPLE_RATE, render_text
 from schemas import (
     AutoScreeningStatusEnum,
+    InterviewQuestionList,
+)
+from services import (
+    InterviewQuestionsService,
+    InterviewService,
+    LLMCacheService,
+    ResumeService,
 )
-from services import InterviewQuestionsService, InterviewService, ResumeService
 
 logger = logging.getLogger(__name__)
 
@@ -87,8 +106,37 @@ class ExtractText:
         return re.sub(r"\n+", "\n", text).strip()
 
 
+async def _cache_get(cache: LLMCacheService, key: str) -> str | None:
+    # Кэш необязателен: при сбое БД запрос просто уходит в LLM
+    try:
+        return await cache.get(key)
+    except Exception as e:
+        logger.error("LLM cache read error", exc_info=e)
+        return None
+
+
+async def _cache_set(
+    cache: LLMCacheService,
+    key: str,
+    purpose: str,
+    value: str,
+    vacancy_id: UUID | None = None,
+) -> None:
+    try:
+        await cache.set(
+            key,
+            purpose,
+            value,
+            ttl=timedelta(days=config.LLM_CACHE_TTL_DAYS),
+            vacancy_id=vacancy_id,
+        )
+    except Exception as e:
+        logger.error("LLM cache write error", exc_info=e)
+
+
 class ResumeAnalyzer:
-    def __init__(self, API_KEY: str) -> None:
+    def __init__(self, API_KEY: str, cache: LLMCacheService | None = None) -> None:
+        self.cache = cache
         self.URL = "https://openrouter.ai/api/v1/chat/completions"
         self.HEADERS = {
             "Authorization": f"Bearer {API_KEY}",
@@ -99,27 +147,34 @@ class ResumeAnalyzer:
 
         user_prompt = f"ТРЕБОВАНИЯ:\n{requirements}\n\nРЕЗЮМЕ:\n{resume_text}"
 
-        return {
-            "model": "deepseek/deepseek-chat-v3.1",
-            "messages": [
-                {"role": "system", "content": AUTO_SCREENING},
+        return build_payload(
+            [
+                get_system_instruction(AUTO_SCREENING),
                 {"role": "user", "content": user_prompt},
             ],
-            "max_tokens": 100,
-            "temperature": 0.1,
-        }
+            max_tokens=100,
+            temperature=0.1,
+        )
 
-    async def execute(self, requirements: str, resume_text: str) -> bool:
+    async def execute(
+        self, requirements: str, resume_text: str, vacancy_id: UUID | None = None
+    ) -> bool:
+        payload = self.build_payload(requirements, resume_text)
+        # Повторная отправка того же резюме на ту же вакансию не идёт в API
+        key = payload_key(payload)
+        if self.cache and (cached := await _cache_get(self.cache, key)) is not None:
+            return cached == "True"
         try:
-            async with httpx.AsyncClient(timeout=60) as client:
-                response = await client.post(
-                    self.URL,
-                    headers=self.HEADERS,
-                    json=self.build_payload(requirements, resume_text),
-                )
-                response.raise_for_status()
-                content = response.json()["choices"][0]["message"]["content"].strip()
-                return content == "True"
+            response = await http_client.post(
+                "screening", self.URL, headers=self.HEADERS, json=payload
+            )
+            response.raise_for_status()
+            data = response.json()
+            llm_usage.record("screening", data.get("usage"))
+            content = data["choices"][0]["message"]["content"].strip()
+            if self.cache:
+                await _cache_set(self.cache, key, "screening", content, vacancy_id)
+            return content == "True"
         except httpx.RequestError as e:
             logger.error("API reques error", exc_info=e)
             raise ConnectionError(f"API reques error: {e}")
@@ -181,13 +236,74 @@ class ResumeProcessUseCase:
         resume_service: ResumeService,
         interview_service: InterviewService,
         question_service: InterviewQuestionsService,
+        llm_cache: LLMCacheService,
         api_key: str,
     ):
         self.resume_service = resume_service
         self.interview_service = interview_service
         self.question_service = question_service
+        self.llm_cache = llm_cache
         self.api_key = api_key
 
+    async def generate_questions(
+        self, vacancy_id: UUID, requirements: str, resume_text: str
+    ) -> list[str]:
+        src_messages = [get_system_instruction(QUESTIONS)]
+        user_text = f"""
+                            На основе этих требований к вакансии:
+                            {requirements}
+
+                            И резюме этого кандидата:
+                            {resume_text}
+
+                            Сгенерируй 5 конкретных вопросов для технического скринингового собеседования.
+                            """
+        key = request_key(
+            src_messages,
+            user_text,
+            max_tokens=5000,
+            response_format=response_format(InterviewQuestionList),
+        )
+        if config.LLM_CACHE_QUESTIONS:
+            cached = await _cache_get(self.llm_cache, key)
+            if cached is not None:
+                return json.loads(cached)
+
+        _, result = await get_structured(
+            src_messages,
+            user_text,
+            InterviewQuestionList,
+            max_tokens=5000,
+            purpose="questions",
+        )
+        questions = result.questions
+        if config.LLM_CACHE_QUESTIONS:
+            await _cache_set(
+                self.llm_cache,
+                key,
+                "questions",
+                json.dumps(questions, ensure_ascii=False),
+                vacancy_id,
+            )
+        return questions
+
+    async def prerender_welcome(self, interview_id: UUID, welcome_text: str) -> None:
+        try:
+            audio = await asyncio.wait_for(
+                render_text(welcome_text), config.TTS_PRERENDER_TIMEOUT_S
+            )
+            await self.question_service.set_welcome_audio(
+                interview_id=interview_id,
+                audio=audio.tobytes(),
+                sample_rate=TTS_SAMPLE_RATE,
+            )
+        except Exception as e:
+            # Без заготовки приветствие будет синтезировано при подключении
+            logger.error(
+                f"Error on rendering welcome audio for interview {interview_id}",
+                exc_info=e,
+            )
+
     async def execute(self, resume_id: UUID) -> None:
         try:
             resume = await self.resume_service.get(id=resume_id)
@@ -199,41 +315,29 @@ class ResumeProcessUseCase:
                 ExtractText().execute, Path(resume.file_path)
             )
 
-            analyzer = ResumeAnalyzer(self.api_key)
-            passed = await analyzer.execute(resume.vacancy.description, file_text)
+            analyzer = ResumeAnalyzer(self.api_key, cache=self.llm_cache)
+            passed = await analyzer.execute(
+                resume.vacancy.description, file_text, vacancy_id=resume.vacancy_id
+            )
 
+            prerender = None
             if passed:
                 status = AutoScreeningStatusEnum.PASSED
                 interview = await self.interview_service.create(resume_id=resume.id)
-                q = (
-                    await get_response(
-                        [get_system_instruction(QUESTIONS)],
-                        f"""
-                            На основе этих требований к вакансии:
-                            {resume.vacancy.description}
-
-                            И резюме этого кандидата:
-                            {file_text}
-
-                            Сгенерируй 5 конкретных вопросов для технического скринингового собеседования.
-                            """,
-                        max_tokens=5000,
-                    )
-                )[1]
-                questions: list[str] = json.loads(q)
+                questions = await self.generate_questions(
+                    resume.vacancy_id, resume.vacancy.description, file_text
+                )
                 welcome_text = await get_response(
-                    [
-                        get_system_instruction(
-                            INTERVIEW.format(questions="\n".join(questions))
-                        )
-                    ],
+                    get_interview_instructions(questions),
                     "Здравствуйте!",
+                    purpose="welcome",
                 )
                 await self.question_service.add(
                     interview_id=interview.id,
                     questions=questions,
                     welcome_text=welcome_text[1],
                 )
+                prerender = (interview.id, welcome_text[1])
 
                 link = f"{config.HOST}/?interview_id={interview.id}"
             else:
@@ -245,6 +349,10 @@ class ResumeProcessUseCase:
 
             email_uc = EmailSendUseCase()
             await email_uc.execute(resume.candidate.email, status, link)
+            # Заготовка приветствия только ускоряет подключение, поэтому
+            # делается после письма и с ограничением по времени
+            if prerender:
+                await self.prerender_welcome(*prerender)
         except Exception as e:
             logger.error(f"Error on processing resume {resume_id}", exc_info=e)
             await self.resume_service.update_auto_screening_status(